@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import pydantic
+import typer
+from typing_extensions import Annotated
+
+import pydantic_typer
+from pydantic_typer import Typer
+
+app = Typer()
+
+
+class Connection(pydantic.BaseModel):
+    host: str = "localhost"
+    port: int = 5432
+
+
+@app.callback()
+def main(connection: Connection):
+    typer.echo(f"Connecting to {connection}")
+
+
+@app.command()
+def query(sql: str, connection: Annotated[Connection, pydantic_typer.Shared()]):
+    typer.echo(f"Query {sql!r} on {connection.host}:{connection.port}")
+
+
+@app.command()
+def status(connection: Annotated[Connection, pydantic_typer.Shared()]):
+    typer.echo(f"Status of {connection.host}:{connection.port}")
+
+
+if __name__ == "__main__":
+    app()
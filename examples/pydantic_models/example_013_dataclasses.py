@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import dataclasses
+
+import pydantic
+import typer
+from typing_extensions import Annotated, NotRequired, TypedDict
+
+import pydantic_typer
+
+
+class Pet(TypedDict):
+    name: str
+    species: NotRequired[str]
+
+
+@pydantic.dataclasses.dataclass
+class Address:
+    city: str
+    country: str = "Switzerland"
+
+
+@dataclasses.dataclass
+class Person:
+    name: Annotated[str, pydantic.Field(description="The name of the person.")]
+    address: Address
+    pet: Pet
+    age: int = 42
+
+
+def main(person: Person):
+    typer.echo(f"{person} {type(person)}")
+
+
+if __name__ == "__main__":
+    pydantic_typer.run(main)
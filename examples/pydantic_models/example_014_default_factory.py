@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import uuid
+from typing import List
+
+import pydantic
+import typer
+
+import pydantic_typer
+
+
+class Job(pydantic.BaseModel):
+    id: uuid.UUID = pydantic.Field(default_factory=uuid.uuid4)
+    tags: List[str] = pydantic.Field(default_factory=lambda: ["default"])  # noqa: UP006 For Python versions >=3.9, prefer list[str]
+
+
+def main(job: Job):
+    typer.echo(f"{job} {type(job)}")
+
+
+if __name__ == "__main__":
+    pydantic_typer.run(main)
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import pydantic
+import typer
+
+import pydantic_typer
+
+
+class Credentials(pydantic.BaseModel):
+    user: str = "admin"
+    password: str = "secret"
+
+
+class Database(pydantic.BaseModel):
+    host: str = "localhost"
+    port: int = 5432
+    credentials: Credentials = Credentials()
+
+
+class Config(pydantic.BaseModel):
+    name: str
+    database: Database = Database()
+
+
+def main(config: Config, *, verbose: bool = False):
+    typer.echo(f"{config} {type(config)}")
+    if verbose:
+        typer.echo(f"Connecting to {config.database.host}")
+
+
+if __name__ == "__main__":
+    pydantic_typer.run(main)
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import pydantic
+import typer
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+import pydantic_typer
+
+
+class Database(pydantic.BaseModel):
+    host: str = "localhost"
+    port: int = 5432
+
+
+class Settings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="APP_", env_nested_delimiter="__", env_file=".env")
+
+    user: str
+    debug: bool = False
+    database: Database = Database()
+
+
+def main(settings: Settings):
+    typer.echo(f"{settings} {type(settings)}")
+
+
+if __name__ == "__main__":
+    pydantic_typer.run(main)
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import hashlib
+from typing import BinaryIO
+
+import pydantic
+import typer
+from pydantic import Base64Bytes, FilePath, NewPath
+from typing_extensions import Annotated
+
+import pydantic_typer
+from pydantic_typer import Stream
+
+
+class Upload(pydantic.BaseModel):
+    data: Annotated[BinaryIO, Stream(FilePath)]
+
+
+def main(
+    upload: Upload,
+    blob: Annotated[memoryview, Stream(Annotated[bytes, pydantic.Field(max_length=1024)])],
+    payload: Annotated[BinaryIO, Stream(Base64Bytes)],
+    output: Annotated[BinaryIO, Stream(NewPath)],
+):
+    typer.echo(f"data: {hashlib.sha256(upload.data.read()).hexdigest()}")
+    typer.echo(f"blob: {bytes(blob[:16])!r} {type(blob)}")
+    typer.echo(f"payload: {payload.read()!r}")
+    output.write(b"done")
+
+
+if __name__ == "__main__":
+    pydantic_typer.run(main)
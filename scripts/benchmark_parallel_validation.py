@@ -0,0 +1,75 @@
+# noqa: INP001
+"""
+Compare validating lists in one call with `parallel_validation` for growing list sizes, to find the crossover point to
+use as `threshold`. Run it with the item type of your commands on the machine running them:
+
+    python scripts/benchmark_parallel_validation.py --workers 4 --chunk-size 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from typing import List
+
+import pydantic
+
+from pydantic_typer.parallel import _get_list_validator, parallel_validation
+
+SIZES = (1_000, 5_000, 10_000, 25_000, 50_000, 100_000, 250_000, 500_000)
+
+
+class Item(pydantic.BaseModel):
+    id: int
+    url: pydantic.HttpUrl
+    tags: List[str]  # noqa: UP006 For Python versions >=3.9, prefer list[str]
+
+
+def _items(size):
+    return [{"id": str(i), "url": f"https://example.com/{i}", "tags": ["a", "b"]} for i in range(size)]
+
+
+def _best_of(repeat, function):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes, the number of CPUs by default")
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    parallel_validation.configure(threshold=0, chunk_size=args.chunk_size, max_workers=args.workers)
+    validator = _get_list_validator(Item)
+    # Start the workers and build their validators before measuring
+    parallel_validation.validate(Item, _items(args.chunk_size * 8))
+
+    # The smallest size from which parallel validation stays faster for all larger sizes
+    crossover = None
+    print(f"{os.cpu_count()} CPUs, {args.workers or os.cpu_count()} workers, chunks of {args.chunk_size} items")  # noqa: T201
+    print(f"{'items':>10} {'single (s)':>12} {'parallel (s)':>14} {'speedup':>8}")  # noqa: T201
+    for size in SIZES:
+        items = _items(size)
+        single = _best_of(args.repeat, lambda items=items: validator.validate_python(items))
+        parallel = _best_of(args.repeat, lambda items=items: parallel_validation.validate(Item, items))
+        if parallel >= single:
+            crossover = None
+        elif crossover is None:
+            crossover = size
+        print(f"{size:>10} {single:>12.4f} {parallel:>14.4f} {single / parallel:>7.2f}x")  # noqa: T201
+    parallel_validation.shutdown()
+    if crossover is None:
+        print("Parallel validation was never faster, keep it disabled.")  # noqa: T201
+    else:
+        print(f"Parallel validation is faster from about {crossover} items, use it as threshold.")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
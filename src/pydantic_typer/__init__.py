@@ -1,3 +1,15 @@
-from pydantic_typer.main import Typer, enable_pydantic, enable_pydantic_type_validation, run
+from pydantic_typer.cache import validation_cache
+from pydantic_typer.main import Shared, Typer, enable_pydantic, enable_pydantic_type_validation, run
+from pydantic_typer.parallel import parallel_validation
+from pydantic_typer.streams import Stream
 
-__all__ = "Typer", "enable_pydantic", "enable_pydantic_type_validation", "run"
+__all__ = (
+    "Shared",
+    "Stream",
+    "Typer",
+    "enable_pydantic",
+    "enable_pydantic_type_validation",
+    "parallel_validation",
+    "run",
+    "validation_cache",
+)
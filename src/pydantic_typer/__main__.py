@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from pathlib import Path  # noqa: TCH003 Typer resolves the annotations at runtime
+from typing import Optional
+
+import typer
+from typing_extensions import Annotated
+
+from pydantic_typer.compiler import compile_app
+
+app = typer.Typer(add_completion=False)
+
+
+@app.callback()
+def main():
+    """Tools for pydantic-typer apps."""
+
+
+@app.command("compile")
+def compile_command(
+    target: Annotated[str, typer.Argument(help="The app to compile, as `module:attribute`.")],
+    output: Annotated[
+        Optional[Path],  # noqa: UP007 For Python versions >=3.10, prefer Path | None
+        typer.Option("--output", "-o", help="The file to write the click module to, defaults to stdout."),
+    ] = None,
+):
+    """
+    Compile a pydantic-typer app into a plain click module, which doesn't need to inspect the app at startup.
+    """
+    source = compile_app(target, str(output) if output else None)
+    if output is None:
+        typer.echo(source, nl=False)
+    else:
+        output.write_text(source)
+
+
+if __name__ == "__main__":
+    app()
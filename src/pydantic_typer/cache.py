@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import copy
+import dataclasses
+import sys
+import threading
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Any, Callable, NamedTuple, TypeVar
+
+import pydantic
+import pydantic_core
+
+T = TypeVar("T")
+
+# Values of these types can't be changed, so they are shared between cache hits instead of being copied.
+_IMMUTABLE_TYPES = (
+    str,
+    bytes,
+    int,
+    float,
+    complex,
+    bool,
+    Decimal,
+    type(None),
+    pydantic_core.Url,
+    pydantic_core.MultiHostUrl,
+)
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    maxbytes: int | None
+    currbytes: int
+
+
+def _normalize(value: Any) -> Any:
+    """
+    Turn raw command line values into a hashable key. Types are part of the key, because e.g. `1`, `1.0` and `True`
+    compare equal, but may be validated differently. Raises `TypeError` for values which can't be normalized.
+    """
+    if isinstance(value, dict):
+        return dict, tuple(sorted((key, _normalize(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_normalize(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return type(value), frozenset(_normalize(item) for item in value)
+    hash(value)
+    return type(value), value
+
+
+def _is_immutable(value: Any) -> bool:
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return True
+    if isinstance(value, pydantic.BaseModel):
+        return bool(value.model_config.get("frozen"))
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return value.__dataclass_params__.frozen  # type: ignore[attr-defined]
+    return False
+
+
+def _approximate_size(value: Any, seen: set[int] | None = None) -> int:
+    """Approximate the memory used by `value` and the objects it references, like `sys.getsizeof` does for one object."""
+    if seen is None:
+        seen = set()
+    if id(value) in seen or isinstance(value, type):
+        # Types in keys are shared with the rest of the program
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value, 0)
+    if isinstance(value, dict):
+        size += sum(_approximate_size(k, seen) + _approximate_size(v, seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_approximate_size(item, seen) for item in value)
+    elif hasattr(value, "__dict__"):
+        size += _approximate_size(vars(value), seen)
+    return size
+
+
+class ValidationCache:
+    """
+    A bounded LRU cache of validated command inputs, shared by all commands in the process.
+
+    Commands validate the same arguments over and over in warm processes and batch jobs. When the cache is enabled, the
+    wrappers created by `enable_pydantic` and `enable_pydantic_type_validation` look up their validated models and
+    values by the normalized raw command line values first. Hits return frozen models and other immutable values as is,
+    everything else is deep copied, so commands can't change the cached value.
+
+    The cache is disabled by default, because validators and default factories don't run again for cache hits.
+
+    ```python
+    from pydantic_typer import validation_cache
+
+    validation_cache.configure(maxsize=256, maxbytes=64 * 1024 * 1024)
+    ...
+    print(validation_cache.cache_info())
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.maxsize = 0
+        self.maxbytes: int | None = None
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Any, tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def configure(self, maxsize: int = 128, maxbytes: int | None = None) -> None:
+        """
+        Enable the cache, or disable it with `maxsize=0`.
+
+        Args:
+            maxsize: The maximum number of cached values.
+            maxbytes: The maximum approximate memory used by the cached values, unbounded if `None`.
+        """
+        with self._lock:
+            self.maxsize = maxsize
+            self.maxbytes = maxbytes
+            self._evict()
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries), self.maxbytes, self._bytes)
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = 0
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.maxsize or (self.maxbytes is not None and self._bytes > self.maxbytes)
+        ):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+
+    def validate(self, key: Any, validate: Callable[[], T]) -> T:
+        """Return the cached value for `key`, or call `validate` and cache its result."""
+        if not self.maxsize:
+            return validate()
+        try:
+            key = _normalize(key)
+        except TypeError:
+            # Unhashable values, which we don't know how to compare
+            return validate()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if entry is not None:
+            value = entry[0]
+            return value if _is_immutable(value) else copy.deepcopy(value)
+
+        value = validate()
+        # The command gets the validated value, so we cache a copy, which it can't change.
+        cached = value if _is_immutable(value) else copy.deepcopy(value)
+        size = _approximate_size(key) + _approximate_size(cached)
+        with self._lock:
+            if self.maxbytes is None or size <= self.maxbytes:
+                previous = self._entries.pop(key, None)
+                if previous is not None:
+                    self._bytes -= previous[1]
+                self._entries[key] = (cached, size)
+                self._bytes += size
+                self._evict()
+        return value
+
+
+validation_cache = ValidationCache()
@@ -0,0 +1,630 @@
+from __future__ import annotations
+
+import ast
+import importlib
+import inspect
+import os
+import sys
+import types
+import typing
+from typing import Any, Callable, Literal, Union, get_args, get_origin
+
+import click
+import pydantic
+from typer import Typer as TyperBase
+from typer.main import (
+    get_command_from_info,
+    get_group_from_info,
+    get_params_convertors_ctx_param_name_from_function,
+    lenient_issubclass,
+    solve_typer_info_defaults,
+)
+from typer.models import CommandInfo, TyperInfo
+from typing_extensions import Annotated
+
+from pydantic_typer.__about__ import __version__
+from pydantic_typer.json_input import JSON_FIELDS_ATTRIBUTE, JSON_FIELDS_META_KEY, JSON_PARAM_PREFIX
+from pydantic_typer.main import (
+    PYDANTIC_MODELS_META_KEY,
+    OmitIfNone,
+    ParsePython,
+    ParseStr,
+    Shared,
+    _get_fields,
+    _get_model_modules,
+    _Qualifier,
+)
+from pydantic_typer.settings import is_settings_model
+from pydantic_typer.utils import inspect_signature, source_fingerprint
+
+
+class CompileError(Exception):
+    pass
+
+
+def load_app(target: str) -> TyperBase:
+    """Load a Typer app from a `module:attribute` string."""
+    module_name, _, attribute = target.partition(":")
+    module = importlib.import_module(module_name)
+    app = getattr(module, attribute or "app")
+    if not isinstance(app, TyperBase):
+        msg = f"{target} is not a Typer app"
+        raise CompileError(msg)
+    return app
+
+
+def _literal(value: Any) -> str:
+    source = repr(value)
+    try:
+        ast.literal_eval(source)
+    except (ValueError, SyntaxError) as e:
+        msg = f"Can't compile value {value!r}, only literals are supported"
+        raise CompileError(msg) from e
+    return source
+
+
+def _click_type_source(param_type: click.ParamType) -> str:
+    if isinstance(param_type, click.Tuple):
+        return f"click.Tuple([{', '.join(_click_type_source(t) for t in param_type.types)}])"
+    if isinstance(param_type, click.Choice):
+        return f"click.Choice({_literal(list(param_type.choices))}, case_sensitive={param_type.case_sensitive!r})"
+    if isinstance(param_type, (click.IntRange, click.FloatRange)):
+        return (
+            f"click.{type(param_type).__name__}(min={param_type.min!r}, max={param_type.max!r}, "
+            f"min_open={param_type.min_open!r}, max_open={param_type.max_open!r}, clamp={param_type.clamp!r})"
+        )
+    if isinstance(param_type, click.DateTime):
+        return f"click.DateTime({_literal(list(param_type.formats))})"
+    if isinstance(param_type, click.File):
+        return (
+            f"click.File(mode={param_type.mode!r}, encoding={param_type.encoding!r}, errors={param_type.errors!r}, "
+            f"lazy={param_type.lazy!r}, atomic={param_type.atomic!r})"
+        )
+    if isinstance(param_type, click.Path):
+        return (
+            f"click.Path(exists={param_type.exists!r}, file_okay={param_type.file_okay!r}, "
+            f"dir_okay={param_type.dir_okay!r}, writable={param_type.writable!r}, readable={param_type.readable!r}, "
+            f"resolve_path={param_type.resolve_path!r}, allow_dash={param_type.allow_dash!r})"
+        )
+    simple_types = {
+        click.types.StringParamType: "click.STRING",
+        click.types.IntParamType: "click.INT",
+        click.types.FloatParamType: "click.FLOAT",
+        click.types.BoolParamType: "click.BOOL",
+        click.types.UUIDParameterType: "click.UUID",
+        click.types.UnprocessedParamType: "click.UNPROCESSED",
+    }
+    for cls, source in simple_types.items():
+        if type(param_type) is cls:
+            return source
+    msg = f"Can't compile parameter type {param_type!r}"
+    raise CompileError(msg)
+
+
+def _param_decorator_source(param: click.Parameter) -> str:
+    if callable(param.default):
+        msg = f"Can't compile parameter {param.name}, default factories are not supported"
+        raise CompileError(msg)
+    kwargs = [f"type={_click_type_source(param.type)}", f"required={param.required!r}"]
+    if param.default is not None:
+        kwargs.append(f"default={_literal(param.default)}")
+    elif isinstance(param, click.Option) and param.is_flag:
+        # Flags default to False otherwise, but None leaves the field to the other settings sources.
+        kwargs.append("default=None")
+    if param.nargs != 1:
+        kwargs.append(f"nargs={param.nargs!r}")
+    if param.metavar:
+        kwargs.append(f"metavar={param.metavar!r}")
+    if param.envvar:
+        kwargs.append(f"envvar={_literal(param.envvar)}")
+
+    if isinstance(param, click.Argument):
+        return f"@click.argument({param.name!r}, {', '.join(kwargs)})"
+
+    assert isinstance(param, click.Option)  # noqa: S101
+    decls = list(param.opts)
+    if param.secondary_opts:
+        decls[0] = f"{decls[0]}/{param.secondary_opts[0]}"
+    decls.append(param.name)  # type: ignore[arg-type]
+    if param.is_flag and not param.secondary_opts:
+        kwargs.append(f"is_flag=True, flag_value={_literal(param.flag_value)}")
+    kwargs += [
+        f"{attribute}=True"
+        for attribute in ("multiple", "count", "hidden", "hide_input", "show_envvar")
+        if getattr(param, attribute)
+    ]
+    if param.show_default is not None:
+        kwargs.append(f"show_default={param.show_default!r}")
+    if param.help:
+        kwargs.append(f"help={param.help!r}")
+    return f"@click.option({', '.join(repr(d) for d in decls)}, {', '.join(kwargs)})"
+
+
+# The names in `typing` of the generic builtins, e.g. `list[int]` is compiled to `typing.List[int]`.
+_TYPING_NAMES = {list: "List", tuple: "Tuple", dict: "Dict", set: "Set", frozenset: "FrozenSet", type: "Type"}
+_UNION_TYPES = (Union, getattr(types, "UnionType", Union))
+
+
+def _annotation_source(annotation: Any, imports: set[str]) -> str:
+    """
+    Compile an annotation into an expression, collecting the modules it needs in `imports`. `Annotated` metadata is
+    left out, the constraints of fields are checked when their model is built.
+    """
+    if annotation is None or annotation is type(None):
+        return "None"
+    if annotation is Ellipsis:
+        return "..."
+    if annotation is Any:
+        imports.add("typing")
+        return "typing.Any"
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin is Annotated:
+        return _annotation_source(args[0], imports)
+    if origin is Literal:
+        imports.add("typing")
+        return f"typing.Literal[{', '.join(_literal(arg) for arg in args)}]"
+    if origin is not None:
+        name = "Union" if origin in _UNION_TYPES else getattr(annotation, "_name", None) or _TYPING_NAMES.get(origin)
+        if name is None or not hasattr(typing, name) or any(isinstance(arg, list) for arg in args):
+            msg = f"Can't compile annotation {annotation!r}"
+            raise CompileError(msg)
+        imports.add("typing")
+        if not args:
+            return f"typing.{name}"
+        return f"typing.{name}[{', '.join(_annotation_source(arg, imports) for arg in args)}]"
+    if not isinstance(annotation, type):
+        msg = f"Can't compile annotation {annotation!r}"
+        raise CompileError(msg)
+    if annotation.__module__ == "builtins":
+        return annotation.__qualname__
+    if annotation.__module__ == "__main__" or "<" in annotation.__qualname__ or "[" in annotation.__qualname__:
+        msg = f"Can't compile annotation {annotation!r}, types must be importable by name"
+        raise CompileError(msg)
+    imports.add(annotation.__module__)
+    return f"{annotation.__module__}.{annotation.__qualname__}"
+
+
+def _field_annotation(annotation: Any, path: list[str]) -> Any:
+    """The annotation of the field at `path` of a flattened model."""
+    for part in path:
+        if get_origin(annotation) is Annotated:
+            annotation = get_args(annotation)[0]
+        annotation = _get_fields(annotation)[part].annotation
+    return annotation
+
+
+def _import_path(callback: Callable[..., Any]) -> tuple[str, str]:
+    original = inspect.unwrap(callback)
+    module_name, qualname = original.__module__, original.__qualname__
+    if module_name == "__main__" or "<locals>" in qualname:
+        msg = f"Can't compile {qualname}, commands must be importable by name"
+        raise CompileError(msg)
+    return module_name, qualname
+
+
+def _field_metadata(callback: Callable[..., Any]) -> tuple[dict[str, tuple[str, ...]], dict[str, str], list[str]]:
+    """
+    Collect the qualifiers and optional fields of flattened models and the parse markers of pydantic types from the
+    wrappers created by `enable_pydantic` and `enable_pydantic_type_validation`.
+    """
+    qualifiers: dict[str, tuple[str, ...]] = {}
+    markers: dict[str, str] = {}
+    optional: list[str] = []
+    function: Any = callback
+    while function is not None:
+        signature = getattr(function, "__signature__", None)
+        for name, parameter in signature.parameters.items() if signature else ():
+            for meta in getattr(parameter.annotation, "__metadata__", ()):
+                if isinstance(meta, _Qualifier):
+                    qualifiers.setdefault(name, tuple(meta))
+                elif meta is ParsePython:
+                    markers.setdefault(name, "python")
+                elif meta is ParseStr:
+                    markers.setdefault(name, "strings")
+                elif meta is OmitIfNone and name not in optional:
+                    optional.append(name)
+        function = getattr(function, "__wrapped__", None)
+    return qualifiers, markers, optional
+
+
+class _Compiler:
+    def __init__(self, target: str, output_dir: str) -> None:
+        self.target = target
+        self.output_dir = output_dir
+        self.lines: list[str] = []
+        self.modules: set[str] = set()
+        self.function_names: set[str] = set()
+
+    def _function_name(self, name: str) -> str:
+        base = "_" + "".join(c if c.isalnum() else "_" for c in name)
+        function_name, i = base, 1
+        while function_name in self.function_names:
+            function_name, i = f"{base}_{i}", i + 1
+        self.function_names.add(function_name)
+        return function_name
+
+    def _callback_lines(
+        self, function_name: str, callback: Callable[..., Any] | None, decorators: list[str]
+    ) -> list[str]:
+        if callback is None:
+            return [*decorators, f"def {function_name}(**kwargs):", "    pass"]
+        json_fields = {name: sorted(fields) for name, fields in getattr(callback, JSON_FIELDS_ATTRIBUTE, {}).items()}
+        json_roots = {name: name[len(JSON_PARAM_PREFIX) :] for name in json_fields}
+        module_name, qualname = _import_path(callback)
+        self.modules.add(module_name)
+        _, _, context_name = get_params_convertors_ctx_param_name_from_function(callback)
+        qualifiers, markers, optional = _field_metadata(callback)
+
+        original = inspect.unwrap(callback)
+        parameters = inspect_signature(original).parameters
+        roots = {}
+        defaults = {}
+        imports = {module_name}
+        # The types of the roots and of the fields parsed with pydantic, resolved now instead of on each invocation
+        annotations = {}
+        for name, parameter in parameters.items():
+            annotation = parameter.annotation
+            _get_model_modules(annotation, self.modules)
+            if get_origin(annotation) is Annotated:
+                if any(isinstance(meta, Shared) for meta in annotation.__metadata__):
+                    roots[name] = "shared"
+                    annotations[name] = _annotation_source(get_args(annotation)[0], imports)
+                    if parameter.default is not inspect.Parameter.empty:
+                        defaults[name] = _literal(parameter.default)
+                    continue
+                annotation = get_args(annotation)[0]
+            if any(qualifier[0] == name for qualifier in qualifiers.values()):
+                if is_settings_model(annotation):
+                    roots[name] = "settings"
+                elif lenient_issubclass(annotation, pydantic.BaseModel):
+                    roots[name] = "model"
+                else:
+                    roots[name] = "validator"
+                annotations[name] = _annotation_source(annotation, imports)
+            elif name not in markers and name != context_name and _needs_conversion(annotation):
+                # Typer converts these after click, e.g. to enums, paths or lists. Pydantic can do the same.
+                markers[name] = "python"
+        hints = False
+        for name in markers:
+            if name in qualifiers:
+                root, *path = qualifiers[name]
+                annotation = _field_annotation(parameters[root].annotation, path)
+                annotations[name] = _annotation_source(annotation, imports)
+            else:
+                # Parameters keep their constraints, so they are validated with their full annotation.
+                annotations[name] = f"hints[{name!r}]"
+                hints = True
+
+        types_name = self._function_name(f"{function_name[1:]}_types")
+        return [
+            f"def {types_name}():",
+            *[f"    import {module}" for module in sorted(imports)],
+            *(["    from typing_extensions import get_type_hints"] if hints else []),
+            "",
+            f"    callback = inspect.unwrap({module_name}.{qualname})",
+            *(["    hints = get_type_hints(callback, include_extras=True)"] if hints else []),
+            f"    return callback, {{{', '.join(f'{name!r}: {source}' for name, source in annotations.items())}}}",
+            "",
+            "",
+            *decorators,
+            f"def {function_name}(**kwargs):",
+            f"    return _invoke({types_name}, kwargs, context={context_name!r},",
+            f"                   roots={roots!r},",
+            f"                   defaults={{{', '.join(f'{name!r}: {source}' for name, source in defaults.items())}}},",
+            f"                   fields={qualifiers!r},",
+            f"                   optional={optional!r},",
+            f"                   parse={markers!r},",
+            f"                   json={json_roots!r})",
+            "",
+            "",
+            # The decorators replaced the function with the click command
+            f"{function_name}.callback.{JSON_FIELDS_ATTRIBUTE} = {json_fields!r}",
+        ]
+
+    def command(self, command_info: CommandInfo, app: TyperBase, parent: str | None) -> str:
+        click_command = get_command_from_info(
+            command_info, pretty_exceptions_short=app.pretty_exceptions_short, rich_markup_mode=app.rich_markup_mode
+        )
+        function_name = self._function_name(click_command.name or "command")
+        decorator = f"{parent}.command" if parent else "click.command"
+        decorators = [
+            f"@{decorator}({click_command.name!r}, cls=_Command, help={click_command.help!r}, epilog={click_command.epilog!r}, "
+            f"short_help={click_command.short_help!r}, hidden={click_command.hidden!r}, "
+            f"deprecated={click_command.deprecated!r}, no_args_is_help={click_command.no_args_is_help!r})",
+            *[_param_decorator_source(param) for param in click_command.params],
+        ]
+        self.lines += ["", "", *self._callback_lines(function_name, command_info.callback, decorators)]
+        return function_name
+
+    def group(self, group_info: TyperInfo, app: TyperBase, parent: str | None) -> str:
+        solved_info = solve_typer_info_defaults(group_info)
+        click_group = get_group_from_info(
+            group_info, pretty_exceptions_short=app.pretty_exceptions_short, rich_markup_mode=app.rich_markup_mode
+        )
+        function_name = self._function_name(click_group.name or "cli")
+        decorator = f"{parent}.group" if parent else "click.group"
+        decorators = [
+            f"@{decorator}({click_group.name or 'cli'!r}, cls=_Group, help={click_group.help!r}, epilog={click_group.epilog!r}, "
+            f"short_help={click_group.short_help!r}, hidden={click_group.hidden!r}, "
+            f"deprecated={click_group.deprecated!r}, no_args_is_help={click_group.no_args_is_help!r}, "
+            f"invoke_without_command={click_group.invoke_without_command!r}, chain={click_group.chain!r})",
+            *[_param_decorator_source(param) for param in click_group.params],
+        ]
+        self.lines += ["", "", *self._callback_lines(function_name, solved_info.callback, decorators)]
+        typer_instance = solved_info.typer_instance
+        assert typer_instance  # noqa: S101
+        for command_info in typer_instance.registered_commands:
+            self.command(command_info, app, function_name)
+        for sub_group_info in typer_instance.registered_groups:
+            self.group(sub_group_info, app, function_name)
+        return function_name
+
+    def compile(self, app: TyperBase) -> str:
+        if app.registered_callback or app.info.callback or app.registered_groups or len(app.registered_commands) > 1:
+            cli = self.group(TyperInfo(app), app, None)
+        elif len(app.registered_commands) == 1:
+            cli = self.command(app.registered_commands[0], app, None)
+        else:
+            msg = f"{self.target} has no commands"
+            raise CompileError(msg)
+
+        sources = sorted(os.path.abspath(inspect.getfile(sys.modules[m])) for m in self.modules)
+        relative_sources = [os.path.relpath(path, self.output_dir) for path in sources]
+        header = _HEADER.format(
+            target=self.target,
+            sources=relative_sources,
+            fingerprint=source_fingerprint(sources),
+            version=__version__,
+            models_key=PYDANTIC_MODELS_META_KEY,
+            json_fields_key=JSON_FIELDS_META_KEY,
+            json_fields_attribute=JSON_FIELDS_ATTRIBUTE,
+        )
+        footer = _FOOTER.format(cli=cli)
+        return "\n".join([header, *self.lines, footer])
+
+
+def _needs_conversion(annotation: Any) -> bool:
+    if annotation in (str, int, float, bool, inspect.Parameter.empty) or lenient_issubclass(annotation, click.Context):
+        return False
+    try:
+        pydantic.TypeAdapter(annotation)
+    except pydantic.PydanticSchemaGenerationError:
+        return False
+    return True
+
+
+def compile_app(target: str, output: str | None = None) -> str:
+    """
+    Compile the Typer app `target` (`module:attribute`) into the source code of a plain click module.
+
+    Args:
+        target: The app to compile, e.g. `myapp:app`.
+        output: The path the module will be written to, used to reference the app's source files relative to it.
+
+    Returns:
+        The source code of the generated module.
+    """
+    app = load_app(target)
+    output_dir = os.path.dirname(os.path.abspath(output)) if output else os.getcwd()
+    compiler = _Compiler(target, output_dir)
+    # The module defining the app is part of the fingerprint, it might register or remove commands.
+    compiler.modules.add(target.partition(":")[0])
+    return compiler.compile(app)
+
+
+_HEADER = '''\
+# Generated by `python -m pydantic_typer compile {target}` (pydantic-typer {version}), do not edit.
+from __future__ import annotations
+
+import copy
+import hashlib
+import inspect
+import os
+import sys
+
+import click
+
+TARGET = {target!r}
+PYDANTIC_TYPER_VERSION = {version!r}
+FINGERPRINT = {fingerprint!r}
+SOURCES = {sources!r}
+
+
+def check_fingerprint():
+    """Exit if one of the sources of the compiled app changed since it was compiled."""
+    digest = hashlib.sha256(PYDANTIC_TYPER_VERSION.encode())
+    try:
+        for path in SOURCES:
+            with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), path), "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+    except OSError:
+        pass
+    else:
+        if digest.hexdigest() == FINGERPRINT:
+            return
+    sys.exit(f"{{__file__}} is out of date, recompile it with `python -m pydantic_typer compile {{TARGET}}`.")
+
+
+class _JsonInput:
+    """Makes the options of a model optional if the whole model is passed as JSON."""
+
+    def parse_args(self, ctx, args):
+        fields = set()
+        json_fields = getattr(self.callback, {json_fields_attribute!r}, None)
+        if json_fields:
+            try:
+                opts, _, _ = self.make_parser(ctx).parse_args(args=list(args))
+            except click.UsageError:
+                opts = {{}}
+            for name, names in json_fields.items():
+                if opts.get(name) is not None:
+                    fields.update(names)
+        ctx.meta[{json_fields_key!r}] = frozenset(fields)
+        return super().parse_args(ctx, args)
+
+    def get_params(self, ctx):
+        json_fields = ctx.meta.get({json_fields_key!r})
+        params = []
+        for param in super().get_params(ctx):
+            if json_fields and param.required and param.name in json_fields:
+                param = copy.copy(param)
+                param.required = False
+            params.append(param)
+        return params
+
+
+class _Command(_JsonInput, click.Command):
+    pass
+
+
+class _Group(_JsonInput, click.Group):
+    pass
+
+
+# The callback of each command and the types of its parameters, resolved on its first invocation
+_RESOLVED_TYPES = {{}}
+# The validator of each annotation, None if pydantic can't validate it
+_VALIDATORS = {{}}
+
+
+def _read_json(value, param_hint):
+    if not value.startswith("@"):
+        return value
+    try:
+        with open(value[1:], "rb") as f:
+            return f.read()
+    except OSError as e:
+        raise click.BadParameter(f"Could not read {{value[1:]}}: {{e.strerror}}", param_hint=param_hint) from e
+
+
+def _is_explicit(ctx, name):
+    source = ctx.get_parameter_source(name)
+    return source not in (click.core.ParameterSource.DEFAULT, click.core.ParameterSource.DEFAULT_MAP)
+
+
+def _parse_json_object(data, name):
+    import pydantic_core
+
+    try:
+        value = pydantic_core.from_json(data)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint=f"--{{name}}-json") from e
+    if not isinstance(value, dict):
+        raise click.BadParameter("Expected a JSON object", param_hint=f"--{{name}}-json")
+    return value
+
+
+def _validator(annotation):
+    import pydantic
+
+    if annotation not in _VALIDATORS:
+        try:
+            _VALIDATORS[annotation] = pydantic.TypeAdapter(annotation)
+        except pydantic.PydanticSchemaGenerationError:
+            _VALIDATORS[annotation] = None
+    return _VALIDATORS[annotation]
+
+
+def _validate(annotation, value, parse, name):
+    import pydantic
+
+    validator = _validator(annotation)
+    if validator is None:
+        return value
+    try:
+        if parse == "strings":
+            return validator.validate_strings(value)
+        return validator.validate_python(value)
+    except pydantic.ValidationError as e:
+        raise click.BadParameter(message=e.errors()[0]["msg"], param_hint=name) from e
+
+
+def _build_root(kind, root_type, values):
+    if kind == "settings":
+        from pydantic_typer.settings import build_settings
+
+        return build_settings(root_type, values)
+    if kind == "validator":
+        return _validator(root_type).validate_python(values)
+    return root_type(**values)
+
+
+def _build_root_from_json(kind, root_type, data, values, name):
+    import pydantic
+
+    try:
+        if kind == "model" and not values:
+            return root_type.model_validate_json(data)
+        if kind == "validator" and not values:
+            return _validator(root_type).validate_json(data)
+        from pydantic_typer.utils import deep_update
+
+        return _build_root(kind, root_type, deep_update(_parse_json_object(data, name), values))
+    except pydantic.ValidationError as e:
+        raise click.BadParameter(str(e), param_hint=f"--{{name}}-json") from e
+
+
+def _invoke(types, kwargs, context, roots, defaults, fields, optional, parse, json):
+    if types not in _RESOLVED_TYPES:
+        _RESOLVED_TYPES[types] = types()
+    callback, annotations = _RESOLVED_TYPES[types]
+    ctx = click.get_current_context()
+    json_values = {{}}
+    for name, root in json.items():
+        value = kwargs.pop(name)
+        if value is not None:
+            json_values[root] = _read_json(value, f"--{{root}}-json")
+    raw_roots = {{name: {{}} for name in roots}}
+    for name, qualifier in fields.items():
+        value = kwargs.pop(name)
+        root, *path = qualifier
+        if name in optional and (value is None or value == ()):
+            # Omitted multiple options are passed as an empty tuple
+            continue
+        if root in json_values and not _is_explicit(ctx, name):
+            continue
+        if name in parse:
+            value = _validate(annotations[name], value, parse[name], name)
+        node = raw_roots[root]
+        for part in path[:-1]:
+            node = node.setdefault(part, {{}})
+        node[path[-1]] = value
+    for name, kind in parse.items():
+        if name in kwargs:
+            kwargs[name] = _validate(annotations[name], kwargs[name], kind, name)
+    validated_models = ctx.meta.setdefault({models_key!r}, {{}}) if roots else {{}}
+    for name, kind in roots.items():
+        root_type = annotations[name]
+        if kind == "shared":
+            matches = [model for model in validated_models.values() if isinstance(model, root_type)]
+            if matches:
+                kwargs[name] = matches[-1]
+            elif name in defaults:
+                kwargs[name] = defaults[name]
+            else:
+                message = f"{{name}} needs a {{root_type.__name__}}, which was not validated by a parent command."
+                raise click.UsageError(message)
+            continue
+        if name in json_values:
+            kwargs[name] = _build_root_from_json(kind, root_type, json_values[name], raw_roots[name], name)
+        else:
+            kwargs[name] = _build_root(kind, root_type, raw_roots[name])
+        validated_models[root_type] = kwargs[name]
+    if context:
+        kwargs[context] = ctx
+    return callback(**kwargs)
+'''
+
+_FOOTER = """
+
+cli = {cli}
+
+
+def main():
+    check_fingerprint()
+    cli()
+
+
+if __name__ == "__main__":
+    main()
+"""
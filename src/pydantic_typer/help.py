@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import contextlib
+import copy
+import hashlib
+import importlib.metadata
+import io
+import json
+import os
+import shutil
+import sys
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator
+
+import click
+from typer.core import TyperCommand
+
+from pydantic_typer.__about__ import __version__
+from pydantic_typer.json_input import JsonInputMixin
+from pydantic_typer.reentrant import ReentrantCallbackMixin
+
+# Key in click.Context.meta for the model path passed to --help, e.g. `--help person.pet`.
+HELP_PATH_META_KEY = "pydantic_typer.help_path"
+# The help of commands with fewer parameters is fast enough to render, so it's not cached.
+HELP_CACHE_MIN_PARAMS = 50
+# The help is only cached if this environment variable names the cache directory.
+HELP_CACHE_DIR_ENV_VAR = "PYDANTIC_TYPER_HELP_CACHE_DIR"
+# The oldest cached help is removed when the cache directory has more files.
+HELP_CACHE_MAX_FILES = 256
+# Attributes which change the help, but are missing from click.Parameter.to_info_dict
+_HELP_PARAM_ATTRIBUTES = ("rich_help_panel", "show_default", "show_envvar", "show_choices", "metavar", "envvar")
+
+
+def _help_cache_dir() -> Path | None:
+    cache_dir = os.environ.get(HELP_CACHE_DIR_ENV_VAR)
+    return Path(cache_dir) if cache_dir else None
+
+
+@lru_cache(maxsize=None)
+def _versions() -> tuple[str | None, ...]:
+    """The versions of the packages rendering the help."""
+    versions: list[str | None] = [__version__]
+    for package in ("typer", "click", "rich"):
+        try:
+            versions.append(importlib.metadata.version(package))
+        except importlib.metadata.PackageNotFoundError:
+            versions.append(None)
+    return tuple(versions)
+
+
+def _prune_help_cache(cache_dir: Path) -> None:
+    with contextlib.suppress(OSError):
+        files = sorted(cache_dir.glob("*.json"), key=lambda path: path.stat().st_mtime_ns)
+        for path in files[: max(len(files) - HELP_CACHE_MAX_FILES, 0)]:
+            path.unlink()
+
+
+def _in_help_path(param: click.Parameter, help_path: str) -> bool:
+    panel = getattr(param, "rich_help_panel", None) or ""
+    return panel == help_path or panel.startswith(f"{help_path}.")
+
+
+class _CapturedOutput(io.StringIO):
+    """Captures help output, while looking like the original stream, so rich renders it the same way."""
+
+    def __init__(self, stream: Any) -> None:
+        super().__init__()
+        self.stream = stream
+
+    def isatty(self) -> bool:
+        return self.stream.isatty()
+
+
+class _StdoutRouter:
+    """
+    Captures what the current thread writes to `sys.stdout`, while the other threads keep writing to the original
+    stream. Rich prints the help to `sys.stdout`, which `contextlib.redirect_stdout` would replace for all threads.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stream: Any = None
+        self._users = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(getattr(self._local, "output", None) or self._stream, name)
+
+    @contextlib.contextmanager
+    def capture(self, output: Any) -> Iterator[None]:
+        with self._lock:
+            if self._users == 0:
+                self._stream = sys.stdout
+                sys.stdout = self  # type: ignore[assignment]
+            self._users += 1
+        self._local.output = output
+        try:
+            yield
+        finally:
+            self._local.output = None
+            with self._lock:
+                self._users -= 1
+                if self._users == 0 and sys.stdout is self:
+                    sys.stdout = self._stream
+
+
+_stdout_router = _StdoutRouter()
+
+
+class PydanticTyperCommand(ReentrantCallbackMixin, JsonInputMixin, TyperCommand):
+    """
+    A `TyperCommand` with help for large models.
+
+    The options of flattened models are grouped into one panel per model path. `--help person.pet` only shows the
+    options below `person.pet`. If `PYDANTIC_TYPER_HELP_CACHE_DIR` is set, the rendered help of commands with many
+    options is cached in that directory, keyed by the click definition of the command and the versions rendering it.
+    """
+
+    def _help_paths(self) -> set[str]:
+        paths = set()
+        for param in self.params:
+            panel = getattr(param, "rich_help_panel", None)
+            while panel:
+                paths.add(panel)
+                panel = panel.rpartition(".")[0]
+        return paths
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        help_option_names = self.get_help_option_names(ctx)
+        for i, arg in enumerate(args[:-1]):
+            if arg in help_option_names and args[i + 1] in self._help_paths():
+                ctx.meta[HELP_PATH_META_KEY] = args[i + 1]
+                args = [*args[: i + 1], *args[i + 2 :]]
+                break
+        return super().parse_args(ctx, args)
+
+    def _help_cache_file(self, ctx: click.Context) -> Path | None:
+        cache_dir = _help_cache_dir()
+        if cache_dir is None or len(self.params) < HELP_CACHE_MIN_PARAMS or self.callback is None:
+            return None
+        # The help depends on the click definition of the command only, wherever it's declared.
+        definition = self.to_info_dict(ctx)
+        definition["params"] = [
+            {**info, **{attribute: getattr(param, attribute, None) for attribute in _HELP_PARAM_ATTRIBUTES}}
+            for info, param in zip(definition["params"], self.get_params(ctx))
+        ]
+        key = [
+            definition,
+            _versions(),
+            self.context_settings,
+            ctx.default_map,
+            ctx.command_path,
+            ctx.meta.get(HELP_PATH_META_KEY),
+            # The markup mode may be a typer.models.DefaultPlaceholder
+            getattr(self.rich_markup_mode, "value", self.rich_markup_mode),
+            tuple(shutil.get_terminal_size()),
+            sys.stdout.isatty(),
+            os.environ.get("TERMINAL_WIDTH"),
+            os.environ.get("NO_COLOR"),
+        ]
+        # Values which can't be serialized, e.g. defaults of custom types, are keyed by their repr.
+        digest = hashlib.sha256(json.dumps(key, default=repr, sort_keys=True).encode()).hexdigest()
+        return cache_dir / f"{digest}.json"
+
+    def _format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        help_path = ctx.meta.get(HELP_PATH_META_KEY)
+        command = self
+        if help_path:
+            command = copy.copy(self)
+            command.params = [param for param in self.params if _in_help_path(param, help_path)]
+        super(PydanticTyperCommand, command).format_help(ctx, formatter)
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        cache_file = self._help_cache_file(ctx)
+        if cache_file is None:
+            self._format_help(ctx, formatter)
+            return
+        try:
+            cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            # Rich prints the help directly, click writes it to the formatter. We capture and cache both.
+            output = _CapturedOutput(sys.stdout)
+            formatter_start = len(formatter.buffer)
+            with _stdout_router.capture(output):
+                self._format_help(ctx, formatter)
+            cached = {"output": output.getvalue(), "formatter": "".join(formatter.buffer[formatter_start:])}
+            del formatter.buffer[formatter_start:]
+            with contextlib.suppress(OSError):
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(json.dumps(cached), encoding="utf-8")
+                _prune_help_cache(cache_file.parent)
+        if cached["output"]:
+            click.echo(cached["output"], nl=False)
+        formatter.write(cached["formatter"])
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import copy
+from itertools import chain
+from pathlib import Path
+from typing import Any
+
+import click
+from typer.core import TyperGroup
+
+from pydantic_typer.reentrant import ReentrantCallbackMixin
+
+# Prefix of the parameters taking a whole model as JSON, followed by the name of the model parameter.
+JSON_PARAM_PREFIX = "_pydantic_json__"
+# Attribute of command callbacks, mapping the names of the JSON parameters to the names of the model's field parameters.
+JSON_FIELDS_ATTRIBUTE = "pydantic_typer_json_fields"
+# Key in click.Context.meta for the field parameters of the models passed as JSON in the current command.
+JSON_FIELDS_META_KEY = "pydantic_typer.json_fields"
+
+
+def read_json(value: str, param_hint: str) -> str | bytes:
+    """Get the JSON passed on the command line, either directly or as `@path` to a JSON file."""
+    if not value.startswith("@"):
+        return value
+    try:
+        return Path(value[1:]).read_bytes()
+    except OSError as e:
+        msg = f"Could not read {value[1:]}: {e.strerror}"
+        raise click.BadParameter(msg, param_hint=param_hint) from e
+
+
+class JsonInputMixin(click.Command):
+    """
+    Makes the options of a model optional if the whole model is passed as JSON, e.g. with `--person-json '{...}'`.
+
+    The options of required fields stay required otherwise, so the help still shows them as required.
+    """
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        # ctx.meta is shared with the parent commands, so we always overwrite the fields of the parent.
+        ctx.meta[JSON_FIELDS_META_KEY] = frozenset()
+        json_fields = getattr(self.callback, JSON_FIELDS_ATTRIBUTE, None)
+        if json_fields:
+            try:
+                opts, _, _ = self.make_parser(ctx).parse_args(args=list(args))
+            except click.UsageError:
+                # The actual parsing will fail with the same error
+                opts = {}
+            ctx.meta[JSON_FIELDS_META_KEY] = frozenset(
+                chain.from_iterable(fields for name, fields in json_fields.items() if opts.get(name) is not None)
+            )
+        return super().parse_args(ctx, args)
+
+    def get_params(self, ctx: click.Context) -> list[click.Parameter]:
+        params = super().get_params(ctx)
+        json_fields = ctx.meta.get(JSON_FIELDS_META_KEY)
+        if not json_fields:
+            return params
+        optional_params = []
+        for param in params:
+            if param.required and param.name in json_fields:
+                # The command's parameters are shared by all invocations, so we only change a copy.
+                param = copy.copy(param)  # noqa: PLW2901
+                param.required = False
+            optional_params.append(param)
+        return optional_params
+
+
+def is_explicit(ctx: Any, name: str) -> bool:
+    """Whether a parameter was passed explicitly, so it overrides the field of a model passed as JSON."""
+    if ctx is None:
+        return True
+    source = ctx.get_parameter_source(name)
+    return source not in (click.core.ParameterSource.DEFAULT, click.core.ParameterSource.DEFAULT_MAP)
+
+
+class PydanticTyperGroup(ReentrantCallbackMixin, JsonInputMixin, TyperGroup):
+    """A `TyperGroup` whose callback can take models as JSON."""
@@ -1,17 +1,27 @@
 from __future__ import annotations
 
+import copy
+import dataclasses
 import importlib
 import inspect
 import re
-from functools import wraps
-from typing import Any, Callable, get_args, get_origin
+import sys
+import threading
+import weakref
+from functools import lru_cache, partial, update_wrapper, wraps
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, NamedTuple, Optional, TypeVar, cast, get_args, get_origin
 
 import click
 import pydantic
+import pydantic_core
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined
 from typer import BadParameter, Option
 from typer import Typer as TyperBase
 from typer.main import CommandFunctionType, get_click_param, get_params_from_function, lenient_issubclass
-from typer.models import OptionInfo, ParameterInfo
+from typer.models import DefaultPlaceholder, OptionInfo, ParameterInfo
 from typer.utils import (
     AnnotatedParamWithDefaultValueError,
     DefaultFactoryAndDefaultValueError,
@@ -19,53 +29,448 @@ from typer.utils import (
     MultipleTyperAnnotationsError,
     _split_annotation_from_typer_annotations,
 )
-from typing_extensions import Annotated
-
-from pydantic_typer.utils import copy_type, deep_update, inspect_signature
+from typing_extensions import Annotated, NotRequired, Required, is_typeddict
+
+from pydantic_typer.cache import validation_cache
+from pydantic_typer.help import PydanticTyperCommand
+from pydantic_typer.json_input import (
+    JSON_FIELDS_ATTRIBUTE,
+    JSON_PARAM_PREFIX,
+    JsonInputMixin,
+    PydanticTyperGroup,
+    is_explicit,
+    read_json,
+)
+from pydantic_typer.parallel import parallel_validation
+from pydantic_typer.settings import build_settings, is_settings_model
+from pydantic_typer.streams import Stream, is_stream
+from pydantic_typer.utils import _get_type_hints, copy_type, deep_update, inspect_signature
 
 PYDANTIC_FIELD_SEPARATOR = "."
+# Key in click.Context.meta, which is shared by all contexts of an invocation, to store the validated models.
+PYDANTIC_MODELS_META_KEY = "pydantic_typer.models"
+# Marks flattened fields that are left out when they are not passed, instead of being set to None.
+OmitIfNone = object()
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+_type_caches_lock = threading.Lock()
+
+
+class Shared:
+    """
+    Marks a pydantic model parameter to receive the instance already validated in the same invocation, e.g. by a group
+    callback or, in chain mode, by a previous command, instead of being flattened into options again.
+
+    ```python
+    @app.command()
+    def query(connection: Annotated[Connection, pydantic_typer.Shared()]): ...
+    ```
+    """
+
+
+def _validated_models() -> dict[type, Any] | None:
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return None
+    return ctx.meta.setdefault(PYDANTIC_MODELS_META_KEY, {})
+
+
+def _get_shared_model(name: str, parameter: inspect.Parameter, model_type: type) -> Any:
+    validated_models = _validated_models() or {}
+    if model_type in validated_models:
+        return validated_models[model_type]
+    for model in reversed(validated_models.values()):
+        if isinstance(model, model_type):
+            return model
+    if parameter.default is not inspect.Parameter.empty:
+        return parameter.default
+    msg = f"{name} needs a {model_type.__name__}, which was not validated by a parent command."
+    raise click.UsageError(msg)
+
+
+def is_flattenable(annotation: Any) -> bool:
+    """Whether `annotation` is a type whose fields are flattened into options: a pydantic model, dataclass or TypedDict."""
+    return (
+        lenient_issubclass(annotation, pydantic.BaseModel)
+        or (isinstance(annotation, type) and dataclasses.is_dataclass(annotation))
+        or is_typeddict(annotation)
+    )
+
+
+def _cache_by_type(function: _F) -> _F:
+    """
+    Cache the results of `function(annotation, *args)` in a dict weakly keyed by the annotation, so they are freed with
+    the type instead of keeping every model that was ever decorated alive. The results must not reference the type.
+    Annotations which can't be weakly referenced are not cached.
+    """
+    cache: weakref.WeakKeyDictionary[Any, dict[tuple[Any, ...], Any]] = weakref.WeakKeyDictionary()
+
+    @wraps(function)
+    def cached(annotation: Any, *args: Any) -> Any:
+        try:
+            results = cache.get(annotation)
+        except TypeError:
+            return function(annotation, *args)
+        if results is not None and args in results:
+            return results[args]
+        result = function(annotation, *args)
+        with _type_caches_lock:
+            # Threads computing the same result at the same time all get the first one.
+            return cache.setdefault(annotation, {}).setdefault(args, result)
+
+    return cast(_F, cached)
+
+
+@_cache_by_type
+def _get_fields(annotation: Any) -> dict[str, FieldInfo]:
+    """Get the pydantic fields of a model, a stdlib or pydantic dataclass or a TypedDict."""
+    if lenient_issubclass(annotation, pydantic.BaseModel):
+        return annotation.model_fields  # type: ignore[attr-defined]
+    if hasattr(annotation, "__pydantic_fields__"):
+        # pydantic dataclasses
+        return annotation.__pydantic_fields__  # type: ignore[attr-defined]
+    type_hints = _get_type_hints(annotation)
+    fields = {}
+    if dataclasses.is_dataclass(annotation):
+        for field in dataclasses.fields(annotation):
+            if not field.init:
+                continue
+            if field.default is not dataclasses.MISSING:
+                default = field.default
+            elif field.default_factory is not dataclasses.MISSING:
+                default = pydantic.Field(default_factory=field.default_factory)
+            else:
+                default = PydanticUndefined
+            fields[field.name] = FieldInfo.from_annotated_attribute(type_hints[field.name], default)
+        return fields
+    for name, type_hint in type_hints.items():
+        if get_origin(type_hint) in (NotRequired, Required):
+            type_hint = get_args(type_hint)[0]  # noqa: PLW2901
+        fields[name] = FieldInfo.from_annotation(type_hint)
+    return fields
+
+
+@_cache_by_type
+def _get_optional_keys(typed_dict: Any) -> frozenset[str]:
+    # __optional_keys__ is wrong for postponed annotations, so we check the resolved type hints.
+    optional_keys = set()
+    for name, type_hint in _get_type_hints(typed_dict).items():
+        origin = get_origin(type_hint)
+        if origin is NotRequired or (origin is not Required and not typed_dict.__total__):  # type: ignore[attr-defined]
+            optional_keys.add(name)
+    return frozenset(optional_keys)
+
+
+def _get_model_modules(annotation: Any, modules: set[str]) -> None:
+    """Collect the modules defining `annotation` and the types of its fields, if it's flattened."""
+    if get_origin(annotation) is Annotated:
+        annotation = get_args(annotation)[0]
+    if is_flattenable(annotation) and annotation.__module__ not in modules:
+        modules.add(annotation.__module__)
+        for field in _get_fields(annotation).values():
+            _get_model_modules(field.annotation, modules)
+
+
+@_cache_by_type
+def _has_streams(annotation: Any) -> bool:
+    """Whether a flattened type has fields opened as streams, which must not be shared by cached models."""
+    for field in _get_fields(annotation).values():
+        if any(isinstance(meta, Stream) for meta in field.metadata):
+            return True
+        if is_flattenable(field.annotation) and _has_streams(field.annotation):
+            return True
+    return False
+
+
+def _describe_default_factory(default_factory: Callable[[], Any]) -> str:
+    """Describe a default factory for the help text, without calling it."""
+    name = getattr(default_factory, "__name__", None)
+    if not name or name == "<lambda>":
+        return "dynamic"
+    return name
+
+
+# Bounded instead of weakly keyed by the type, because the validators reference their types.
+@lru_cache(maxsize=128)
+def _get_validator(annotation: type) -> pydantic.TypeAdapter:
+    return pydantic.TypeAdapter(annotation)
+
+
+def _build_model(model_type: type, values: dict[str, Any]) -> Any:
+    if lenient_issubclass(model_type, pydantic.BaseModel):
+        return model_type(**values)
+    return _get_validator(model_type).validate_python(values)
+
+
+def _build_model_from_json(model_type: type, data: str | bytes) -> Any:
+    if lenient_issubclass(model_type, pydantic.BaseModel):
+        return model_type.model_validate_json(data)  # type: ignore[attr-defined]
+    return _get_validator(model_type).validate_json(data)
+
+
+def _json_option(name: str) -> inspect.Parameter:
+    """The option taking the whole model parameter `name` as JSON, e.g. `--person-json '{...}'` or `--person @file.json`."""
+    option = Option(
+        f"--{name}-json",
+        f"--{name}",
+        metavar="JSON",
+        show_default=False,
+        help=f"The {name} as JSON, or @path to a JSON file.",
+        rich_help_panel=name,
+    )
+    return inspect.Parameter(
+        f"{JSON_PARAM_PREFIX}{name}",
+        inspect.Parameter.KEYWORD_ONLY,
+        annotation=Annotated[Optional[str], option],
+        default=None,
+    )
+
+
+def _option_names(parameter: inspect.Parameter) -> list[str]:
+    """The option names typer declares for a parameter, without building its click parameter."""
+    _, typer_annotations = _split_annotation_from_typer_annotations(parameter.annotation)
+    decls: list[str] = []
+    if typer_annotations:
+        typer_param = typer_annotations[0]
+        # In Annotated, the first positional argument of typer.Option is a declaration, not the default.
+        if isinstance(typer_param.default, str):
+            decls.append(typer_param.default)
+    else:
+        typer_param = parameter.default
+    if isinstance(typer_param, OptionInfo):
+        decls += typer_param.param_decls or ()
+    elif isinstance(typer_param, ParameterInfo) or parameter.default is inspect.Parameter.empty:
+        return []
+    names = [name.strip() for decl in decls for name in decl.split("/") if name.strip().startswith("-")]
+    return names or [f"--{parameter.name.replace('_', '-')}"]
+
+
+def _check_json_options(
+    callback: Callable[..., Any], signature: inspect.Signature, roots: tuple[_RootPlan, ...]
+) -> None:
+    """Raise if the options taking the models as JSON would shadow other options of the command."""
+    options: dict[str, str] = {}
+    for parameter in signature.parameters.values():
+        if parameter.name.startswith(JSON_PARAM_PREFIX):
+            continue
+        # Flattened fields are named by their path in the model, e.g. person.pet.name
+        qualifiers = [
+            meta for meta in getattr(parameter.annotation, "__metadata__", ()) if isinstance(meta, _Qualifier)
+        ]
+        label = ".".join(qualifiers[0]) if qualifiers else parameter.name
+        for name in _option_names(parameter):
+            options.setdefault(name, label)
+    for root in roots:
+        for name in (f"--{root.name}-json", f"--{root.name}"):
+            if name in options:
+                msg = (
+                    f"{name} of {callback.__qualname__} takes {root.name} as JSON, "
+                    f"but it is also an option of {options[name]}."
+                )
+                raise RuntimeError(msg)
+            options[name] = f"the JSON of {root.name}"
+
+
+class _Qualifier(tuple):
+    """The path of a flattened field in its model parameter, e.g. `("person", "pet", "name")`."""
+
+    __slots__ = ()
+
+
+def _intern_qualifier(parts: tuple[str, ...]) -> _Qualifier:
+    """
+    Build the qualifier of a path from interned strings. Qualifiers are shared by all commands using the same model with
+    the same parameter name through the cached parameters, there is no global table keeping them alive.
+    """
+    return _Qualifier(sys.intern(part) for part in parts)
 
 
 def _flatten_pydantic_model(
-    model: pydantic.BaseModel, ancestors: list[str], ancestor_typer_param=None
-) -> dict[str, inspect.Parameter]:
-    pydantic_parameters = {}
-    for field_name, field in model.model_fields.items():
-        qualifier = [*ancestors, field_name]
-        sub_name = f"_pydantic_{'_'.join(qualifier)}"
-        if lenient_issubclass(field.annotation, pydantic.BaseModel):
+    model: Any, ancestors: tuple[str, ...], ancestor_typer_param: ParameterInfo | None = None
+) -> tuple[inspect.Parameter, ...]:
+    """
+    Flatten the fields of `model` into parameters. The parameters are immutable, so they are cached and shared by all
+    commands using the same model with the same parameter name. Fields taking the typer param of the model parameter
+    are built for each command, because that typer param belongs to the command.
+    """
+    if ancestor_typer_param is None:
+        return _flatten_shared_model(model, ancestors)
+    return _flatten_model(model, ancestors, ancestor_typer_param)
+
+
+@_cache_by_type
+def _flatten_shared_model(model: Any, ancestors: tuple[str, ...]) -> tuple[inspect.Parameter, ...]:
+    return _flatten_model(model, ancestors, None)
+
+
+def _flatten_model(
+    model: Any, ancestors: tuple[str, ...], ancestor_typer_param: ParameterInfo | None
+) -> tuple[inspect.Parameter, ...]:
+    pydantic_parameters: list[inspect.Parameter] = []
+    for field_name, field in _get_fields(model).items():
+        qualifier = _intern_qualifier((*ancestors, field_name))
+        sub_name = sys.intern(f"_pydantic_{'_'.join(qualifier)}")
+        if is_flattenable(field.annotation):
             # TODO: pass ancestor_typer_param
-            params = _flatten_pydantic_model(field.annotation, qualifier)  # type: ignore
-            pydantic_parameters.update(params)
+            pydantic_parameters += _flatten_pydantic_model(field.annotation, qualifier)
         else:
             default = (
                 field.default if field.default is not pydantic.fields._Unset else ...  # noqa: SLF001
             )
+            annotation = field.annotation
+            if any(isinstance(meta, Stream) for meta in field.metadata):
+                # Streamed fields take the path of a file, which is opened when the model is validated.
+                annotation = Path
+            metadata: list[Any] = [qualifier]
+            if is_typeddict(model) and field_name in _get_optional_keys(model):
+                # Keys which are not required are left out of the TypedDict, unless they are passed.
+                default = None
+                metadata.append(OmitIfNone)
+            elif field.default_factory is not None:
+                # Leave the field out unless it is passed, so the factory only runs if it's needed, during validation.
+                default = None
+                metadata.append(OmitIfNone)
             # Pydantic stores annotations in field.metadata.
             # If the field is already annotated with a typer.Option or typer.Argument, use that.
+            # We only change copies, the typer params in field.metadata are shared by all commands using the model.
             existing_typer_params = [meta for meta in field.metadata if isinstance(meta, ParameterInfo)]
+            from_ancestor = not existing_typer_params and ancestor_typer_param is not None
             typer_param: ParameterInfo
             if existing_typer_params:
-                typer_param = existing_typer_params[0]
+                typer_param = copy.copy(existing_typer_params[0])
                 if isinstance(typer_param, OptionInfo) and not typer_param.param_decls:
                     # If the the option was not named manually, use the default naming scheme
                     typer_param.param_decls = (f"--{PYDANTIC_FIELD_SEPARATOR.join(qualifier)}",)
-            elif ancestor_typer_param:
-                typer_param = ancestor_typer_param
+            elif ancestor_typer_param is not None:
+                typer_param = copy.copy(ancestor_typer_param)
             else:
                 typer_param = Option(f"--{PYDANTIC_FIELD_SEPARATOR.join(qualifier)}")
 
+            # Group the options in the help by model path
+            if not from_ancestor and typer_param.rich_help_panel is None:
+                typer_param.rich_help_panel = PYDANTIC_FIELD_SEPARATOR.join(ancestors)
+
             # Copy Field metadata to Option, fixes https://github.com/pypae/pydantic-typer/issues/2
             if field.description and not typer_param.help:
                 typer_param.help = field.description
+            if field.default_factory is not None and not from_ancestor and typer_param.show_default is True:
+                typer_param.show_default = _describe_default_factory(field.default_factory)
+
+            pydantic_parameters.append(
+                inspect.Parameter(
+                    sub_name,
+                    inspect.Parameter.KEYWORD_ONLY,
+                    annotation=Annotated[(annotation, typer_param, *metadata)],
+                    default=default,
+                )
+            )
+    return tuple(pydantic_parameters)
 
-            pydantic_parameters[sub_name] = inspect.Parameter(
-                sub_name,
-                inspect.Parameter.KEYWORD_ONLY,
-                annotation=Annotated[field.annotation, typer_param, qualifier],
-                default=default,
+
+def _get_annotations(signature: inspect.Signature) -> dict[str, Any]:
+    """
+    Copy annotations to make forward references work in Python <= 3.9. Typer ignores the type hints of parameters with
+    typer annotations, like the flattened fields, so their shared annotations aren't copied into every wrapper.
+    """
+    return {
+        name: parameter.annotation
+        for name, parameter in signature.parameters.items()
+        if not _split_annotation_from_typer_annotations(parameter.annotation)[1]
+    }
+
+
+class _FlattenedField(NamedTuple):
+    qualifier: _Qualifier
+    omit_if_none: bool
+
+
+@dataclasses.dataclass(frozen=True)
+class _RootPlan:
+    """How the wrapper rebuilds one flattened model parameter from its options, computed once per command."""
+
+    name: str
+    model_type: type
+    # The name of the parameter taking the model as JSON
+    json_name: str
+    # The names of the parameters of the model's fields
+    fields: Mapping[str, _FlattenedField]
+    settings: bool
+    # Whether the model is looked up in the validation cache, settings and models with streams are always validated.
+    cached: bool
+
+    def validate(self, value: dict[str, Any]) -> Any:
+        if self.cached:
+            return validation_cache.validate((self.model_type, value), partial(_build_model, self.model_type, value))
+        return _build_model(self.model_type, value)
+
+    def validate_json(self, data: str | bytes) -> Any:
+        if self.cached:
+            return validation_cache.validate(
+                (self.model_type, data), partial(_build_model_from_json, self.model_type, data)
             )
-    return pydantic_parameters
+        return _build_model_from_json(self.model_type, data)
+
+    def build(self, json_value: str | None, values: Mapping[str, Any]) -> Any:
+        """Build the model from the options of its fields, the JSON passed for it, if any, and its settings sources."""
+        ctx = click.get_current_context(silent=True)
+        data = None if json_value is None else read_json(json_value, f"--{self.name}-json")
+        raw_value: dict[str, Any] = {}
+        for name, value in values.items():
+            field = self.fields[name]
+            if value is None and field.omit_if_none:
+                continue
+            if data is not None and not is_explicit(ctx, name):
+                # Defaults don't override the fields passed as JSON
+                continue
+            for part in reversed(field.qualifier[1:]):
+                value = {part: value}  # noqa: PLW2901
+            raw_value = deep_update(raw_value, value)
+        if data is None:
+            return self._validate_fields(raw_value)
+        try:
+            if not raw_value and not self.settings:
+                # Without overrides, pydantic validates the JSON directly
+                return self.validate_json(data)
+            return self._validate_fields(deep_update(_parse_json_object(data, self.name), raw_value))
+        except pydantic.ValidationError as e:
+            raise BadParameter(str(e), param_hint=f"--{self.name}-json") from e
+
+    def _validate_fields(self, raw_value: dict[str, Any]) -> Any:
+        if self.settings:
+            return build_settings(self.model_type, raw_value)
+        return self.validate(raw_value)
+
+    def literal(self) -> str | None:
+        """
+        The source of a dict display nesting the parameters of the fields like the model, e.g.
+        `{'name': _pydantic_person_name, 'pet': {'name': _pydantic_person_pet_name}}`. The generated wrappers validate it
+        directly if there is no JSON, unless fields have to be left out.
+        """
+        if self.settings or any(field.omit_if_none for field in self.fields.values()):
+            return None
+        tree: dict[str, Any] = {}
+        for name, field in self.fields.items():
+            node = tree
+            for part in field.qualifier[1:-1]:
+                node = node.setdefault(part, {})
+            node[field.qualifier[-1]] = name
+
+        def display(node: dict[str, Any]) -> str:
+            items = (f"{key!r}: {value if isinstance(value, str) else display(value)}" for key, value in node.items())
+            return f"{{{', '.join(items)}}}"
+
+        return display(tree)
+
+
+def _parse_json_object(data: str | bytes, root_name: str) -> dict[str, Any]:
+    try:
+        value = pydantic_core.from_json(data)
+    except ValueError as e:
+        raise BadParameter(str(e), param_hint=f"--{root_name}-json") from e
+    if not isinstance(value, dict):
+        msg = "Expected a JSON object"
+        raise BadParameter(msg, param_hint=f"--{root_name}-json")
+    return value
 
 
 def enable_pydantic(callback: CommandFunctionType) -> CommandFunctionType:
@@ -78,26 +483,95 @@ def enable_pydantic(callback: CommandFunctionType) -> CommandFunctionType:
     passed into the command-line interface. Nested Pydantic models are also supported, and their fields are appropriately
     namespaced.
 
+    `pydantic_settings.BaseSettings` models are supported as well. Their options are all optional, values passed on the
+    command line are layered on top of the other settings sources, which are only resolved once per process.
+
+    Each model can also be passed as JSON, e.g. `--person-json '{"name": "Jeff"}'` or `--person @person.json`, which
+    pydantic validates directly. The options of the model's fields override the fields in the JSON.
+
+    Validated models are stored in the click context, so parameters marked with `Shared` can reuse them in subcommands.
+    If the `validation_cache` is enabled, models are looked up by the raw values of their fields first.
+
+    The model's metadata is never modified, everything the wrapper needs is computed into an immutable plan when
+    decorating. Invoking the wrapper only reads that plan and the click context, so the same command can be decorated
+    from several threads. The commands built by `Typer` collect the values of each invocation in a new dict, instead of
+    the single dict per command of typer's callbacks, so one built command can also be invoked concurrently, e.g. from a
+    thread pool.
+
     Args:
         callback: The original command function to be wrapped.
 
     Returns:
-        A wrapped function with an extended signature that includes the flattened Pydantic model fields.
+        A wrapped function with an extended signature that includes the flattened Pydantic model fields, or `callback`
+        itself if it has no model parameters.
+    """
+    signature, roots, shared = _plan_models(callback)
+    return _specialize(callback, signature, roots=roots, shared=shared)
+
+
+def _settings_parameter(parameter: inspect.Parameter) -> inspect.Parameter:
+    """
+    Leave a settings field out unless its option is passed. Boolean fields also get a `--no-` option, so the command
+    line can override a true value from the other sources.
     """
+    annotation, typer_param, *metadata = get_args(parameter.annotation)
+    # The typer param may be shared with other commands, so we only change a copy.
+    typer_param = copy.copy(typer_param)
+    # Not passing the option leaves the field to the other sources, which the help can't show.
+    typer_param.show_default = False
+    if annotation in (bool, Optional[bool]) and isinstance(typer_param, OptionInfo):
+        # In Annotated, the first positional argument of typer.Option is a declaration, not the default.
+        decls: list[str] = [*(typer_param.param_decls or ())]
+        if isinstance(typer_param.default, str):
+            decls.insert(0, typer_param.default)
+        long_decls = [decl for decl in decls if decl.startswith("--")]
+        if long_decls and not any("/" in decl for decl in decls):
+            typer_param.default = ...
+            typer_param.param_decls = tuple(
+                f"{decl}/--no-{decl[2:]}" if decl == long_decls[0] else decl for decl in decls
+            )
+    return parameter.replace(annotation=Annotated[(annotation, typer_param, *metadata, OmitIfNone)], default=None)
+
+
+def _plan_models(
+    callback: Callable[..., Any],
+) -> tuple[inspect.Signature, tuple[_RootPlan, ...], Mapping[str, tuple[inspect.Parameter, type]]]:
+    """Flatten the model parameters of `callback` into its extended signature and plan how to rebuild them."""
     original_signature = inspect_signature(callback)
 
-    pydantic_parameters = {}
-    pydantic_roots = {}
+    model_parameters = []
+    roots = []
+    shared_parameters = {}
     other_parameters = {}
     for name, parameter in original_signature.parameters.items():
         base_annotation, typer_annotations = _split_annotation_from_typer_annotations(parameter.annotation)
         typer_param = typer_annotations[0] if typer_annotations else None
-        if lenient_issubclass(base_annotation, pydantic.BaseModel):
-            params = _flatten_pydantic_model(parameter.annotation, [name], typer_param)
-            pydantic_parameters.update(params)
-            pydantic_roots[name] = base_annotation
+        if any(isinstance(meta, Shared) for meta in getattr(parameter.annotation, "__metadata__", ())):
+            shared_parameters[name] = (parameter, base_annotation)
+        elif is_flattenable(base_annotation):
+            params = {p.name: p for p in _flatten_pydantic_model(base_annotation, (name,), typer_param)}
+            settings = is_settings_model(base_annotation)
+            if settings:
+                # Settings fields may be provided by other sources, so only the options passed explicitly are used.
+                params = {k: _settings_parameter(p) for k, p in params.items()}
+            json_parameter = _json_option(name)
+            model_parameters += [json_parameter, *params.values()]
+            fields = {}
+            for param_name, param in params.items():
+                _, qualifier, *markers = param.annotation.__metadata__
+                fields[param_name] = _FlattenedField(qualifier, OmitIfNone in markers)
+            roots.append(
+                _RootPlan(
+                    name=name,
+                    model_type=base_annotation,
+                    json_name=json_parameter.name,
+                    fields=MappingProxyType(fields),
+                    settings=settings,
+                    cached=not settings and not _has_streams(base_annotation),
+                )
+            )
         elif get_origin(base_annotation) in (list, tuple) and any(
-            lenient_issubclass(arg, pydantic.BaseModel) for arg in get_args(base_annotation)
+            is_flattenable(arg) for arg in get_args(base_annotation)
         ):
             msg = f"Type not yet supported: {base_annotation}, see https://github.com/pypae/pydantic-typer/issues/6"
             raise RuntimeError(msg)
@@ -105,32 +579,11 @@ def enable_pydantic(callback: CommandFunctionType) -> CommandFunctionType:
             other_parameters[name] = parameter
 
     extended_signature = inspect.Signature(
-        [*other_parameters.values(), *pydantic_parameters.values()],
+        [*other_parameters.values(), *model_parameters],
         return_annotation=original_signature.return_annotation,
     )
-
-    @copy_type(callback)
-    @wraps(callback)
-    def wrapper(*args, **kwargs):  # type: ignore[no-untyped-def]
-        converted_kwargs = kwargs.copy()
-        raw_pydantic_objects: dict[str, Any] = {}
-        for kwarg_name in kwargs:
-            if kwarg_name in pydantic_parameters:
-                kwarg_value = kwargs[kwarg_name]
-                converted_kwargs.pop(kwarg_name)
-                annotation = pydantic_parameters[kwarg_name].annotation
-                _, qualifier = annotation.__metadata__
-                for part in reversed(qualifier):
-                    kwarg_value = {part: kwarg_value}
-                raw_pydantic_objects = deep_update(raw_pydantic_objects, kwarg_value)
-        for root_name, value in raw_pydantic_objects.items():
-            converted_kwargs[root_name] = pydantic_roots[root_name](**value)
-        return callback(*args, **converted_kwargs)
-
-    wrapper.__signature__ = extended_signature  # type: ignore
-    # Copy annotations to make forward references work in Python <= 3.9
-    wrapper.__annotations__ = {k: v.annotation for k, v in extended_signature.parameters.items()}
-    return wrapper
+    _check_json_options(callback, extended_signature, tuple(roots))
+    return extended_signature, tuple(roots), MappingProxyType(shared_parameters)
 
 
 def _recursive_replace_annotation(original_annotation, type_to_replace, replacement):
@@ -146,7 +599,7 @@ def _recursive_replace_annotation(original_annotation, type_to_replace, replacem
         args = get_args(original_annotation)
         updated_args = []
         for arg in args:
-            if lenient_issubclass(arg, pydantic.BaseModel):
+            if is_flattenable(arg):
                 # lists of pydantic.BaseModels are handled in enable_pydantic,
                 # so we don't need to replace their annotation.
                 updated_args.append(arg)
@@ -174,6 +627,53 @@ ParsePython = object()
 ParseStr = object()
 
 
+def _list_item_type(annotation: Any) -> Any:
+    """The item type of a list annotation without constraints on the whole list, whose items can be validated apart."""
+    metadata: list[Any] = []
+    if get_origin(annotation) is Annotated:
+        annotation, *metadata = get_args(annotation)
+    if any(not isinstance(meta, (ParameterInfo, _Qualifier)) and meta is not OmitIfNone for meta in metadata):
+        return None
+    if get_origin(annotation) is not list or not get_args(annotation):
+        return None
+    return get_args(annotation)[0]
+
+
+def _converter(name: str, annotation: Any, parse_as: object, cache_token: object) -> Callable[[Any], Any]:
+    """Create the function validating the raw value of parameter `name` with pydantic, building its validator once."""
+    validator: pydantic.TypeAdapter | None = None
+    stream = is_stream(annotation)
+    # Values parsed from strings are never lists
+    item_type = None if stream or parse_as is ParseStr else _list_item_type(annotation)
+
+    def validate(value: Any) -> Any:
+        nonlocal validator
+        if item_type is not None and parallel_validation.applies(value):
+            return parallel_validation.validate(item_type, value)
+        if validator is None:
+            validator = pydantic.TypeAdapter(annotation)
+        if parse_as is ParseStr:
+            return validator.validate_strings(value)
+        return validator.validate_python(value)
+
+    def convert(value: Any) -> Any:
+        try:
+            if stream:
+                # Streams are opened by validation, so they are never shared.
+                return validate(value)
+            return validation_cache.validate((cache_token, name, value), partial(validate, value))
+        except pydantic.PydanticSchemaGenerationError:
+            return value
+        except pydantic.ValidationError as e:
+            error = e.errors()[0]
+            message = error["msg"]
+            if item_type is not None and error["loc"]:
+                message += f" (item {error['loc'][0]})"
+            raise BadParameter(message=message, param_hint=name) from e
+
+    return convert
+
+
 def enable_pydantic_type_validation(callback: CommandFunctionType) -> CommandFunctionType:
     """
     A decorator that ensures Pydantic validation is applied to parameters of Typer commands, including those with types
@@ -181,21 +681,32 @@ def enable_pydantic_type_validation(callback: CommandFunctionType) -> CommandFun
 
     This decorator modifies the function's signature to replace unsupported types with `str`, allowing them to be
     parsed and validated by Pydantic at runtime. It ensures that the parameters are validated according to the Pydantic
-    model definitions, raising appropriate errors if validation fails.
+    model definitions, raising appropriate errors if validation fails. If the `validation_cache` is enabled, validated
+    values are looked up by their raw values first.
 
     Args:
         callback: The original command function to be wrapped.
 
     Returns:
-        A wrapped function that validates its parameters using Pydantic before execution.
+        A wrapped function that validates its parameters using Pydantic before execution, or `callback` itself if none
+        of its parameters need pydantic.
     """
-    original_signature = inspect_signature(callback)
+    signature, conversions = _plan_type_validation(callback)
+    return _specialize(callback, signature, conversions=conversions)
+
+
+def _plan_type_validation(function: Callable[..., Any]) -> tuple[inspect.Signature, Mapping[str, Callable[[Any], Any]]]:
+    """
+    Change the signature of `function` for typer to pass the values of unsupported types as strings and create the
+    converters validating them with pydantic.
+    """
+    original_signature = inspect_signature(function)
     # Change the annotation of unsupported types to str to be parsed by pydantic.
     # Adapted from https://github.com/tiangolo/typer/blob/95b767e38a98ee287a7a0e28176284836e1188c2/typer/main.py#L543
     # TODO: it's not ideal to call get_params_from_function and get_click_param here,
     # because it will be called in typer again, but the annotations supported by typer are quite dynamic.
     try:
-        parameters = get_params_from_function(callback)
+        parameters = get_params_from_function(function)
     except (
         AnnotatedParamWithDefaultValueError,
         DefaultFactoryAndDefaultValueError,
@@ -206,11 +717,19 @@ def enable_pydantic_type_validation(callback: CommandFunctionType) -> CommandFun
         parameters = {}
 
     updated_parameters = dict(original_signature.parameters)
+    parse_markers = {}
     for param_name, param in parameters.items():
         original_parameter = original_signature.parameters[param_name]
         if lenient_issubclass(param.annotation, click.Context):
             # click.Context should not be modified
             continue
+        if is_stream(original_parameter.annotation):
+            # Streamed parameters take the path of a file, which pydantic validates and opens.
+            parse_markers[param_name] = ParsePython
+            updated_parameters[param_name] = original_parameter.replace(
+                annotation=Annotated[(Path, *original_parameter.annotation.__metadata__, ParsePython)]
+            )
+            continue
         # We don't know wheter to use pydantic or typer to parse a param without checking if typer supports it.
         try:
             get_click_param(param)
@@ -226,14 +745,10 @@ def enable_pydantic_type_validation(callback: CommandFunctionType) -> CommandFun
                 error_type,
                 str,
             )
-
-            updated_parameter = inspect.Parameter(
-                param_name,
-                kind=original_parameter.kind,
-                default=original_parameter.default,
-                annotation=Annotated[updated_annotation, ParsePython],
+            parse_markers[param_name] = ParsePython
+            updated_parameters[param_name] = original_parameter.replace(
+                annotation=Annotated[updated_annotation, ParsePython]
             )
-            updated_parameters[param_name] = updated_parameter
         except AssertionError as e:
             # Assertion error is raised for union and list types with complex sub-types,
             # which we support by using str and parsing that with pydantic.
@@ -242,62 +757,232 @@ def enable_pydantic_type_validation(callback: CommandFunctionType) -> CommandFun
                 # Do not modify param, will be raised again by typer.
                 continue
             if "Typer Currently doesn't support Union types" in e.args:
-                updated_parameters[param_name] = inspect.Parameter(
-                    param_name,
-                    kind=original_parameter.kind,
-                    default=original_parameter.default,
-                    annotation=Annotated[str, ParseStr],
+                # Keep the typer parameter and the qualifier of flattened fields.
+                metadata = getattr(original_parameter.annotation, "__metadata__", ())
+                parse_markers[param_name] = ParseStr
+                updated_parameters[param_name] = original_parameter.replace(
+                    annotation=Annotated[(str, *metadata, ParseStr)]
                 )
 
     new_signature = inspect.Signature(
         parameters=list(updated_parameters.values()), return_annotation=original_signature.return_annotation
     )
+    # Identifies the parameters of this command in the validation cache
+    cache_token = object()
+    conversions = {
+        name: _converter(name, original_signature.parameters[name].annotation, parse_as, cache_token)
+        for name, parse_as in parse_markers.items()
+    }
+    return new_signature, MappingProxyType(conversions)
+
+
+def _stand_in(function: Callable[..., Any], signature: inspect.Signature) -> Callable[..., Any]:
+    """A function with the given signature, which typer inspects like `function`, but which is never called."""
+
+    def stand_in(*_args: Any, **_kwargs: Any) -> Any:  # pragma: no cover
+        raise NotImplementedError
+
+    stand_in.__wrapped__ = function  # type: ignore[attr-defined]
+    stand_in.__signature__ = signature  # type: ignore[attr-defined]
+    stand_in.__annotations__ = _get_annotations(signature)
+    return stand_in
+
+
+def _arguments_source(signature: inspect.Signature, namespace: dict[str, Any]) -> str:
+    """The source of the parameter list of a generated function, defaults are looked up in `namespace`."""
+    arguments = []
+    keyword_only = False
+    for index, parameter in enumerate(signature.parameters.values()):
+        if parameter.kind is inspect.Parameter.VAR_POSITIONAL:
+            keyword_only = True
+            arguments.append(f"*{parameter.name}")
+            continue
+        if parameter.kind is inspect.Parameter.VAR_KEYWORD:
+            arguments.append(f"**{parameter.name}")
+            continue
+        if parameter.kind is inspect.Parameter.KEYWORD_ONLY and not keyword_only:
+            keyword_only = True
+            arguments.append("*")
+        argument = parameter.name
+        if parameter.default is not inspect.Parameter.empty:
+            default_name = f"__pydantic_typer_default_{index}"
+            namespace[default_name] = parameter.default
+            argument += f"={default_name}"
+        arguments.append(argument)
+        if parameter.kind is inspect.Parameter.POSITIONAL_ONLY and (
+            index + 1 == len(signature.parameters)
+            or list(signature.parameters.values())[index + 1].kind is not inspect.Parameter.POSITIONAL_ONLY
+        ):
+            arguments.append("/")
+    return ", ".join(arguments)
+
+
+def _call_source(signature: inspect.Signature) -> str:
+    """The source of the arguments passing the local variables named like the parameters of a call."""
+    arguments = []
+    for parameter in signature.parameters.values():
+        if parameter.kind is inspect.Parameter.POSITIONAL_ONLY:
+            arguments.append(parameter.name)
+        elif parameter.kind is inspect.Parameter.VAR_POSITIONAL:
+            arguments.append(f"*{parameter.name}")
+        elif parameter.kind is inspect.Parameter.VAR_KEYWORD:
+            arguments.append(f"**{parameter.name}")
+        else:
+            arguments.append(f"{parameter.name}={parameter.name}")
+    return ", ".join(arguments)
+
+
+def _specialize(
+    callback: CommandFunctionType,
+    signature: inspect.Signature,
+    *,
+    roots: tuple[_RootPlan, ...] = (),
+    shared: Mapping[str, tuple[inspect.Parameter, type]] = MappingProxyType({}),
+    conversions: Mapping[str, Callable[[Any], Any]] = MappingProxyType({}),
+) -> CommandFunctionType:
+    """
+    Generate the wrapper of a command, which takes the parameters of `signature` explicitly and only does what the
+    command needs, in a single call frame: validating the values of pydantic types with their `conversions`, looking up
+    the `shared` models and building the flattened models from their `roots`. Commands without any of those are not
+    wrapped at all.
 
-    @copy_type(callback)
-    @wraps(callback)
-    def wrapper(*args, **kwargs):  # type: ignore[no-untyped-def]
-        bound_params = original_signature.bind(*args, **kwargs)
-        for name, value in bound_params.arguments.items():
-            annotation = original_signature.parameters[name].annotation
-            updated_annotation = new_signature.parameters[name].annotation
-            if annotation == updated_annotation:
-                continue
-            # We only need to parse parameters where we changed the annotation
-            try:
-                type_adapter = pydantic.TypeAdapter(annotation)
-            except pydantic.PydanticSchemaGenerationError:
-                continue
+    Roots without JSON and without fields left out when they are `None` are validated from a dict display of their
+    fields, everything else goes through `_RootPlan.build`.
+    """
+    if not roots and not shared and not conversions:
+        return callback
+    namespace: dict[str, Any] = {
+        "__pydantic_typer_callback": callback,
+        "__pydantic_typer_get_shared_model": _get_shared_model,
+        "__pydantic_typer_validated_models": _validated_models,
+    }
+    lines = [f"def wrapper({_arguments_source(signature, namespace)}):"]
+    for index, (name, convert) in enumerate(conversions.items()):
+        namespace[f"__pydantic_typer_convert_{index}"] = convert
+        lines.append(f"    {name} = __pydantic_typer_convert_{index}({name})")
+    for index, (name, (parameter, model_type)) in enumerate(shared.items()):
+        namespace[f"__pydantic_typer_shared_{index}"] = (parameter, model_type)
+        lines.append(f"    {name} = __pydantic_typer_get_shared_model({name!r}, *__pydantic_typer_shared_{index})")
+    if roots:
+        lines.append("    __pydantic_typer_models = __pydantic_typer_validated_models()")
+    for index, root in enumerate(roots):
+        plan = f"__pydantic_typer_root_{index}"
+        namespace[plan] = root
+        build = f"{plan}.build({root.json_name}, {{{', '.join(f'{name!r}: {name}' for name in root.fields)}}})"
+        literal = root.literal()
+        if literal is None:
+            lines.append(f"    {root.name} = {build}")
+        else:
+            lines += [
+                f"    if {root.json_name} is None:",
+                f"        {root.name} = {plan}.validate({literal})",
+                "    else:",
+                f"        {root.name} = {build}",
+            ]
+        lines += [
+            "    if __pydantic_typer_models is not None:",
+            f"        __pydantic_typer_models[{plan}.model_type] = {root.name}",
+        ]
+    lines.append(f"    return __pydantic_typer_callback({_call_source(inspect_signature(callback))})")
+    exec(compile("\n".join(lines), f"<pydantic_typer wrapper of {callback.__qualname__}>", "exec"), namespace)  # noqa: S102
+    wrapper = update_wrapper(namespace["wrapper"], callback)
+    if roots:
+        setattr(
+            wrapper,
+            JSON_FIELDS_ATTRIBUTE,
+            MappingProxyType({root.json_name: frozenset(root.fields) for root in roots}),
+        )
+    wrapper.__signature__ = signature  # type: ignore[attr-defined]
+    wrapper.__annotations__ = _get_annotations(signature)
+    return cast(CommandFunctionType, wrapper)
+
+
+def _enable_pydantic_support(f: CommandFunctionType) -> CommandFunctionType:
+    """Apply `enable_pydantic` and `enable_pydantic_type_validation` to `f`, with a single generated wrapper."""
+    signature, roots, shared = _plan_models(f)
+    if roots or shared:
+        signature, conversions = _plan_type_validation(_stand_in(f, signature))
+    else:
+        signature, conversions = _plan_type_validation(f)
+    return _specialize(f, signature, roots=roots, shared=shared, conversions=conversions)
+
+
+def _group_cls(typer_instance: TyperBase) -> Any:
+    """The group class set with `@app.callback(cls=...)` or `Typer(cls=...)`, in the order typer looks for it."""
+    registered_callback = typer_instance.registered_callback
+    for cls in (registered_callback.cls if registered_callback else None, typer_instance.info.cls):
+        if cls is not None and not isinstance(cls, DefaultPlaceholder):
+            return cls
+    return None
+
+
+def _check_json_input(cls: Any, callback: Callable[..., Any]) -> None:
+    """Models passed as JSON make the options of their fields optional, which needs the `JsonInputMixin`."""
+    if getattr(callback, JSON_FIELDS_ATTRIBUTE, None) and not lenient_issubclass(cls, JsonInputMixin):
+        msg = (
+            f"{cls.__name__} can't take the models of {callback.__qualname__} as JSON, "
+            f"subclass {PydanticTyperCommand.__module__}.{PydanticTyperCommand.__name__} "
+            f"or {PydanticTyperGroup.__module__}.{PydanticTyperGroup.__name__} instead."
+        )
+        raise RuntimeError(msg)
 
-            try:
-                # We can be sure that the last arg is a parse_as marker, because of the
-                # if annotation == updated_annotation conditon above.
-                *_, parse_as = get_args(updated_annotation)
-                if parse_as is ParsePython:
-                    bound_params.arguments[name] = type_adapter.validate_python(value)
-                elif parse_as is ParseStr:
-                    bound_params.arguments[name] = type_adapter.validate_strings(value)
-            except pydantic.ValidationError as e:
-                raise BadParameter(message=e.errors()[0]["msg"], param_hint=name) from e
-        callback(*bound_params.args, **bound_params.kwargs)
 
-    wrapper.__signature__ = new_signature  # type: ignore
-    # Copy annotations to make forward references work in Python <= 3.9
-    wrapper.__annotations__ = {k: v.annotation for k, v in new_signature.parameters.items()}
-    return wrapper
+class Typer(TyperBase):
+    """
+    A `typer.Typer` whose commands and callbacks take pydantic models. Its groups are `PydanticTyperGroup`s and its
+    commands are `PydanticTyperCommand`s, unless other classes are set with `cls`. Those must subclass the pydantic-typer
+    classes for commands taking models as JSON.
+    """
 
+    @copy_type(TyperBase.__init__)
+    def __init__(self, *args, **kwargs):
+        if kwargs.get("cls") is None:
+            kwargs["cls"] = PydanticTyperGroup
+        if callable(kwargs.get("callback")):
+            kwargs["callback"] = _enable_pydantic_support(kwargs["callback"])
+            _check_json_input(kwargs["cls"], kwargs["callback"])
+        super().__init__(*args, **kwargs)
 
-class Typer(TyperBase):
     @copy_type(TyperBase.command)
     def command(self, *args, **kwargs):
+        if kwargs.get("cls") is None:
+            kwargs["cls"] = PydanticTyperCommand
         original_decorator = super().command(*args, **kwargs)
 
         def decorator_override(f: CommandFunctionType) -> CommandFunctionType:
-            f = enable_pydantic(f)
-            f = enable_pydantic_type_validation(f)
-            return original_decorator(f)
+            wrapper = _enable_pydantic_support(f)
+            _check_json_input(kwargs["cls"], wrapper)
+            return original_decorator(wrapper)
 
         return decorator_override
 
+    @copy_type(TyperBase.callback)
+    def callback(self, *args, **kwargs):
+        if kwargs.get("cls") is None:
+            # Leave the group class to Typer(cls=...), which is PydanticTyperGroup by default.
+            kwargs.pop("cls", None)
+        original_decorator = super().callback(*args, **kwargs)
+
+        def decorator_override(f: CommandFunctionType) -> CommandFunctionType:
+            wrapper = _enable_pydantic_support(f)
+            _check_json_input(kwargs.get("cls") or _group_cls(self), wrapper)
+            return original_decorator(wrapper)
+
+        return decorator_override
+
+    @copy_type(TyperBase.add_typer)
+    def add_typer(self, *args, **kwargs):
+        typer_instance = args[0] if args else kwargs["typer_instance"]
+        if kwargs.get("cls") is None:
+            kwargs.pop("cls", None)
+            if _group_cls(typer_instance) is None:
+                # Plain typer.Typer instances don't set a group class.
+                kwargs["cls"] = PydanticTyperGroup
+        if callable(kwargs.get("callback")):
+            kwargs["callback"] = _enable_pydantic_support(kwargs["callback"])
+            _check_json_input(kwargs.get("cls") or _group_cls(typer_instance), kwargs["callback"])
+        return super().add_typer(*args, **kwargs)
+
 
 def run(function: Callable[..., Any]) -> None:
     app = Typer(add_completion=False)
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, List
+
+import pydantic
+import pydantic_core
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+@lru_cache(maxsize=128)
+def _get_cached_list_validator(item_type: Any) -> pydantic.TypeAdapter:
+    return pydantic.TypeAdapter(List[item_type])
+
+
+def _get_list_validator(item_type: Any) -> pydantic.TypeAdapter:
+    """Each worker builds the validator of an item type once, unless the type can't be hashed."""
+    try:
+        return _get_cached_list_validator(item_type)
+    except TypeError:
+        return pydantic.TypeAdapter(List[item_type])
+
+
+def _validate_chunk(item_type: Any, start: int, items: list[Any]) -> tuple[list[Any] | None, list[dict[str, Any]]]:
+    """
+    Validate a chunk of a list in a worker. Errors are returned instead of raised, with the indices of the whole list,
+    because validation errors can't be pickled.
+    """
+    try:
+        return _get_list_validator(item_type).validate_python(items), []
+    except pydantic.ValidationError as e:
+        return None, [
+            {
+                "type": error["type"],
+                "loc": _offset_loc(error["loc"], start),
+                "msg": error["msg"],
+                "input": error["input"],
+            }
+            for error in e.errors(include_url=False, include_context=False)
+        ]
+
+
+def _offset_loc(loc: tuple[int | str, ...], start: int) -> tuple[int | str, ...]:
+    """Move the location of an error in a chunk to the index of the item in the whole list."""
+    if loc and isinstance(loc[0], int):
+        return (loc[0] + start, *loc[1:])
+    return (start, *loc)
+
+
+class ParallelValidation:
+    """
+    Validates very large list parameters in chunks across a process pool, instead of in a single call on one core.
+
+    When enabled, the wrappers created by `enable_pydantic_type_validation` split lists with at least `threshold`
+    items into chunks of `chunk_size` items, validate the chunks in the pool and merge the results in order. Errors
+    are reported with the indices of the items in the whole list. Smaller lists are validated in the calling thread.
+
+    Sending the items to other processes and the validated items back often costs more than validating them, so
+    parallel validation is disabled by default and has no default threshold. It can only pay off with several cores
+    and expensive item types; measure the crossover point with scripts/benchmark_parallel_validation.py on the machine
+    running the commands, and keep it disabled if there is none. The item type and the validated items must be
+    picklable, so item types must be importable by the workers.
+
+    ```python
+    from pydantic_typer import parallel_validation
+
+    parallel_validation.configure(threshold=100_000, max_workers=4)
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.threshold: int | None = None
+        self.chunk_size = DEFAULT_CHUNK_SIZE
+        self.max_workers: int | None = None
+        self._executor: Executor | None = None
+        self._own_executor = False
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        threshold: int | None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: int | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        """
+        Enable parallel validation, or disable it with `threshold=None`.
+
+        Args:
+            threshold: The number of items from which lists are validated in parallel, the measured crossover point.
+            chunk_size: The number of items validated at once by a worker.
+            max_workers: The number of worker processes, the number of CPUs if `None`.
+            executor: The executor validating the chunks, instead of a process pool created on first use.
+        """
+        if chunk_size < 1:
+            msg = "chunk_size must be at least 1"
+            raise ValueError(msg)
+        with self._lock:
+            self._shutdown()
+            self.threshold = threshold
+            self.chunk_size = chunk_size
+            self.max_workers = max_workers
+            self._executor = executor
+
+    def shutdown(self) -> None:
+        """Shut down the process pool created on first use, a new one is created if it's needed again."""
+        with self._lock:
+            self._shutdown()
+
+    def _shutdown(self) -> None:
+        if self._own_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self._own_executor = False
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(self.max_workers)
+                self._own_executor = True
+            return self._executor
+
+    def applies(self, value: Any) -> bool:
+        """Whether `value` is large enough to be validated in parallel."""
+        return self.threshold is not None and isinstance(value, (list, tuple)) and len(value) >= self.threshold
+
+    def validate(self, item_type: Any, value: list[Any] | tuple[Any, ...]) -> list[Any]:
+        """Validate `value` as a list of `item_type` in chunks, like `TypeAdapter(List[item_type])` does at once."""
+        executor = self._get_executor()
+        chunk_size = self.chunk_size
+        futures = [
+            executor.submit(_validate_chunk, item_type, start, list(value[start : start + chunk_size]))
+            for start in range(0, len(value), chunk_size)
+        ]
+        items: list[Any] = []
+        errors: list[pydantic_core.InitErrorDetails] = []
+        for future in futures:
+            chunk, chunk_errors = future.result()
+            if chunk_errors:
+                errors += [
+                    {
+                        # The messages were already formatted by the workers
+                        "type": pydantic_core.PydanticCustomError(error["type"], error["msg"]),
+                        "loc": error["loc"],
+                        "input": error["input"],
+                    }
+                    for error in chunk_errors
+                ]
+            elif chunk is not None and not errors:
+                items += chunk
+        if errors:
+            raise pydantic.ValidationError.from_exception_data(title="list", line_errors=errors)
+        return items
+
+
+parallel_validation = ParallelValidation()
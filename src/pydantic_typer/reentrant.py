@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from functools import update_wrapper
+from typing import Any, Callable
+
+import click
+
+# The free variables of the callback wrapper created by typer.main.get_callback
+_TYPER_WRAPPER_VARIABLES = frozenset(("callback", "use_params", "use_convertors", "context_param_name"))
+
+
+def reentrant_callback(callback: Callable[..., Any] | None) -> Callable[..., Any] | None:
+    """
+    Replace the callback wrapper typer creates for a command with one that can be invoked from several threads at once.
+
+    Typer's wrapper collects the values of every invocation in a single dict per command, so concurrent invocations
+    could call the command with each other's values. The replacement converts the values like typer's wrapper, into a
+    new dict per invocation. Callbacks which weren't created by typer are returned unchanged.
+    """
+    code = getattr(callback, "__code__", None)
+    closure = getattr(callback, "__closure__", None)
+    if code is None or closure is None or not set(code.co_freevars) >= _TYPER_WRAPPER_VARIABLES:
+        return callback
+    variables = {name: cell.cell_contents for name, cell in zip(code.co_freevars, closure)}
+    function = variables["callback"]
+    # The wrapper is replaced before the command is invoked, so the dict only holds the defaults.
+    defaults = dict(variables["use_params"])
+    convertors = variables["use_convertors"]
+    context_param_name = variables["context_param_name"]
+    pretty_exceptions_short = variables.get("pretty_exceptions_short", False)
+
+    def wrapper(**kwargs: Any) -> Any:
+        # Rich hides the frames above this one in pretty tracebacks, like in typer's wrapper
+        _rich_traceback_guard = pretty_exceptions_short
+        params = dict(defaults)
+        for name, value in kwargs.items():
+            params[name] = convertors[name](value) if name in convertors else value
+        if context_param_name:
+            params[context_param_name] = click.get_current_context()
+        return function(**params)
+
+    return update_wrapper(wrapper, function)
+
+
+class ReentrantCallbackMixin(click.Command):
+    """Makes the typer callback of a command safe to invoke from several threads at once, see `reentrant_callback`."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.callback = reentrant_callback(self.callback)
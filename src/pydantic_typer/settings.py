@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+
+import pydantic
+
+from pydantic_typer.utils import deep_update
+
+try:
+    import pydantic_settings
+except ImportError:  # pragma: no cover
+    pydantic_settings = None  # type: ignore[assignment]
+
+
+# Resolved source values per settings class: {settings_cls: (cache_key, [(is_init_source, values), ...])}
+_resolved_sources: dict[type, tuple[Any, list[tuple[bool, dict[str, Any]]]]] = {}
+
+
+def is_settings_model(annotation: Any) -> bool:
+    return (
+        pydantic_settings is not None
+        and isinstance(annotation, type)
+        and issubclass(annotation, pydantic_settings.BaseSettings)
+    )
+
+
+def _as_paths(value: Any) -> list[Path]:
+    if value is None:
+        return []
+    if isinstance(value, (str, os.PathLike)):
+        return [Path(value)]
+    return [Path(v) for v in value]
+
+
+def _mtime(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _cache_key(settings_cls: type) -> Any:
+    """
+    Everything the settings sources read from outside the process: env files, secret files and environment variables.
+    """
+    config = settings_cls.model_config  # type: ignore[attr-defined]
+    env_files = tuple((path, _mtime(path)) for path in _as_paths(config.get("env_file")))
+    secrets = []
+    for secrets_dir in _as_paths(config.get("secrets_dir")):
+        secrets.append((secrets_dir, _mtime(secrets_dir)))
+        if secrets_dir.is_dir():
+            secrets.extend((path, _mtime(path)) for path in sorted(secrets_dir.iterdir()))
+    return os.getcwd(), env_files, tuple(secrets), frozenset(os.environ.items())
+
+
+def _resolve_sources(settings_cls: type) -> list[tuple[bool, dict[str, Any]]]:
+    key = _cache_key(settings_cls)
+    cached = _resolved_sources.get(settings_cls)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    init_settings = pydantic_settings.InitSettingsSource(settings_cls, init_kwargs={})  # type: ignore[arg-type]
+    sources = settings_cls.settings_customise_sources(  # type: ignore[attr-defined]
+        settings_cls,
+        init_settings=init_settings,
+        env_settings=pydantic_settings.EnvSettingsSource(settings_cls),  # type: ignore[arg-type]
+        dotenv_settings=pydantic_settings.DotEnvSettingsSource(settings_cls),  # type: ignore[arg-type]
+        file_secret_settings=pydantic_settings.SecretsSettingsSource(settings_cls),  # type: ignore[arg-type]
+    )
+    # The init source is where the values passed on the command line go, so we keep its position but don't resolve it.
+    resolved = [(source is init_settings, {} if source is init_settings else source()) for source in sources]
+    _resolved_sources[settings_cls] = (key, resolved)
+    return resolved
+
+
+def build_settings(settings_cls: type, cli_values: dict[str, Any]) -> Any:
+    """
+    Build a `pydantic_settings.BaseSettings` instance from the values passed on the command line.
+
+    The other settings sources (environment, dotenv files, secrets, ...) are resolved once and reused until one of the
+    files they read or the environment changes. Command line values take the place of the init source, so they are
+    layered with the precedence defined in `settings_customise_sources`.
+    """
+    state: dict[str, Any] = {}
+    for is_init_source, values in _resolve_sources(settings_cls):
+        state = deep_update(cli_values if is_init_source else values, state)
+    # BaseSettings.__init__ would resolve all sources again, so we skip it and validate like a plain BaseModel.
+    settings: Any = object.__new__(settings_cls)
+    pydantic.BaseModel.__init__(settings, **state)
+    return settings
+
+
+def clear_settings_cache() -> None:
+    _resolved_sources.clear()
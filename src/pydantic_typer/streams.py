@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import mmap
+import os
+import stat
+from pathlib import Path, PurePath
+from typing import TYPE_CHECKING, Any, Callable, get_args, get_origin
+
+import click
+from pydantic.types import Base64Encoder, Base64UrlEncoder, EncodedBytes
+from pydantic_core import PydanticCustomError, core_schema
+from typer.main import lenient_issubclass
+from typing_extensions import Annotated
+
+if TYPE_CHECKING:
+    from pydantic import GetCoreSchemaHandler
+
+# Size of the encoded chunks read from a file at once by a decoding stream.
+DECODE_CHUNK_SIZE = 1024 * 1024
+
+
+def _close_with_context(close: Callable[[], None]) -> None:
+    """Close a stream when the current click context closes, like click does for `click.File` parameters."""
+    ctx = click.get_current_context(silent=True)
+    if ctx is not None:
+        ctx.call_on_close(close)
+
+
+def _stat_file(path: Path) -> os.stat_result:
+    try:
+        info = path.stat()
+    except OSError as e:
+        msg = f"Could not read file: {e.strerror}"
+        raise ValueError(msg) from e
+    if not stat.S_ISREG(info.st_mode):
+        msg = "Path does not point to a file"
+        raise ValueError(msg)
+    if not os.access(path, os.R_OK):
+        msg = "File is not readable"
+        raise ValueError(msg)
+    return info
+
+
+def _open_path(path: Path) -> click.utils.LazyFile:
+    """Open a path validated by pydantic, e.g. a `FilePath` for reading or a `NewPath` for writing, on first use."""
+    if path.exists():
+        try:
+            file = click.utils.LazyFile(path, "rb")
+        except OSError as e:
+            msg = f"Could not open file: {e.strerror}"
+            raise ValueError(msg) from e
+    else:
+        if not os.access(path.parent, os.W_OK):
+            msg = "Directory is not writable"
+            raise ValueError(msg)
+        file = click.utils.LazyFile(path, "wb")
+    _close_with_context(file.close_intelligently)
+    return file
+
+
+def _map_file(path: Path) -> memoryview:
+    with path.open("rb") as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped
+            return memoryview(b"")
+    view = memoryview(mapped)
+
+    def close() -> None:
+        view.release()
+        with contextlib.suppress(BufferError):
+            # Slices of the view still reference the mapping, it will be closed when they are garbage collected.
+            mapped.close()
+
+    _close_with_context(close)
+    return view
+
+
+class _DecodingReader(io.RawIOBase):
+    """Decodes a base64 encoded file in chunks, so it's never loaded into memory at once."""
+
+    def __init__(self, path: Path, encoder: type[Base64Encoder | Base64UrlEncoder]) -> None:
+        super().__init__()
+        self.path = path
+        self.encoder = encoder
+        self._file: io.BufferedReader | None = None
+        self._encoded = b""
+        self._decoded = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def _decode_chunk(self) -> bool:
+        if self._file is None:
+            self._file = self.path.open("rb")
+        chunk = self._file.read(DECODE_CHUNK_SIZE)
+        # Base64 decodes in blocks of 4 characters, line breaks in the file are ignored.
+        encoded = self._encoded + b"".join(chunk.split())
+        if chunk:
+            end = len(encoded) - len(encoded) % 4
+            encoded, self._encoded = encoded[:end], encoded[end:]
+        elif not encoded:
+            return False
+        else:
+            # The last block is decoded as is, so incomplete input raises a decoding error.
+            self._encoded = b""
+        try:
+            self._decoded = memoryview(self.encoder.decode(encoded))
+        except PydanticCustomError as e:
+            raise ValueError(str(e)) from e
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._decoded:
+            if not self._decode_chunk():
+                return 0
+        size = min(len(buffer), len(self._decoded))
+        buffer[:size] = self._decoded[:size]
+        self._decoded = self._decoded[size:]
+        return size
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        super().close()
+
+
+def _bytes_source(schema: core_schema.CoreSchema) -> tuple[core_schema.BytesSchema, type[Any] | None]:
+    """Get the bytes schema and the encoder, if any, from the schema of a `bytes` or `EncodedBytes` annotation."""
+    encoder = None
+    if schema["type"] == "function-after":
+        decode = schema["function"]["function"]  # type: ignore[typeddict-item]
+        if isinstance(getattr(decode, "__self__", None), EncodedBytes):
+            encoder = decode.__self__.encoder
+            schema = schema["schema"]  # type: ignore[typeddict-item]
+    if schema["type"] != "bytes" or (encoder is not None and (len(schema) > 1)):
+        msg = "Stream() supports bytes with length constraints or base64 encoded bytes without constraints."
+        raise TypeError(msg)
+    if encoder is not None and not issubclass(encoder, (Base64Encoder, Base64UrlEncoder)):
+        msg = f"Stream() can't decode {encoder.__name__} in chunks, only base64 encoded bytes are supported."
+        raise TypeError(msg)
+    return schema, encoder  # type: ignore[return-value]
+
+
+class Stream:
+    """
+    Marks a file or bytes parameter to be passed to the command as a lazily opened stream, instead of being read into
+    memory. Only the metadata of the file, such as its existence, size and permissions, is validated.
+
+    The annotated type is the type the command receives, the type passed to `Stream` is validated on the command line:
+
+    ```python
+    def main(
+        # Passed as a lazily opened binary file, for reading if it exists and for writing otherwise
+        data: Annotated[BinaryIO, Stream(FilePath)],
+        # The option takes a path, the file size is checked and its content is passed as a memoryview of a mmap
+        blob: Annotated[
+            memoryview, Stream(Annotated[bytes, Field(max_length=2**30)])
+        ],
+        # The option takes the path of a base64 encoded file, which is passed as a binary stream decoding it in chunks
+        payload: Annotated[BinaryIO, Stream(Base64Bytes)],
+    ): ...
+    ```
+
+    `Stream()` without a type validates the annotated type, e.g. `Annotated[FilePath, Stream()]`, but then the annotation
+    doesn't match the value the command receives.
+
+    Streams are closed when the click context of the command closes.
+    """
+
+    def __init__(self, source: Any = None) -> None:
+        self.source = source
+
+    def __get_pydantic_core_schema__(self, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        if self.source is None:
+            schema = handler(source)
+        else:
+            source = self.source
+            schema = handler.generate_schema(source)
+        if get_origin(source) is Annotated:
+            # e.g. FilePath or Base64Bytes, the constraints are part of the schema
+            source = get_args(source)[0]
+        if lenient_issubclass(source, PurePath):
+            # Pydantic validates the path type, e.g. FilePath or NewPath, which only looks at the file system.
+            return core_schema.no_info_after_validator_function(_open_path, schema)
+        if source is not bytes:
+            msg = f"Stream() supports paths and bytes, not {source}."
+            raise TypeError(msg)
+        bytes_schema, encoder = _bytes_source(schema)
+        min_length = bytes_schema.get("min_length")
+        max_length = bytes_schema.get("max_length")
+
+        def validate(value: str | os.PathLike[str]) -> Any:
+            path = Path(value)
+            size = _stat_file(path).st_size
+            if min_length is not None and size < min_length:
+                msg = f"File should have at least {min_length} bytes"
+                raise ValueError(msg)
+            if max_length is not None and size > max_length:
+                msg = f"File should have at most {max_length} bytes"
+                raise ValueError(msg)
+            if encoder is None:
+                return _map_file(path)
+            stream = io.BufferedReader(_DecodingReader(path, encoder), DECODE_CHUNK_SIZE)
+            _close_with_context(stream.close)
+            return stream
+
+        return core_schema.no_info_after_validator_function(
+            validate,
+            core_schema.union_schema([core_schema.str_schema(), core_schema.is_instance_schema(PurePath)]),
+        )
+
+
+def is_stream(annotation: Any) -> bool:
+    return any(isinstance(meta, Stream) for meta in getattr(annotation, "__metadata__", ()))
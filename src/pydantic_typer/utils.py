@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import hashlib
 import inspect
 import sys
 from typing import Any, Callable, TypeVar, get_type_hints
 
+from pydantic_typer.__about__ import __version__
+
 KeyType = TypeVar("KeyType")
 
 
@@ -37,8 +40,10 @@ def inspect_signature(func: Callable[..., Any]) -> inspect.Signature:  # pragma:
         resolved_params = []
         for p in raw_signature.parameters:
             old_param = raw_signature.parameters[p]
+            # Generated wrappers leave the annotations of flattened fields out, their signature has them resolved.
+            annotation = type_hints.get(p, old_param.annotation)
             resolved_params.append(
-                inspect.Parameter(old_param.name, old_param.kind, default=old_param.default, annotation=type_hints[p])
+                inspect.Parameter(old_param.name, old_param.kind, default=old_param.default, annotation=annotation)
             )
 
         signature = raw_signature.replace(parameters=resolved_params)
@@ -51,3 +56,12 @@ _T = TypeVar("_T")
 def copy_type(_: _T) -> Callable[[Any], _T]:
     """Source https://github.com/python/typing/issues/769#issuecomment-903760354"""
     return lambda x: x
+
+
+def source_fingerprint(paths: list[str]) -> str:
+    """A fingerprint of the pydantic-typer version and the contents of the given source files."""
+    digest = hashlib.sha256(__version__.encode())
+    for path in paths:
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
@@ -0,0 +1,124 @@
+import subprocess
+import sys
+
+import pydantic
+import typer
+from typer.testing import CliRunner
+from typing_extensions import Annotated
+
+import pydantic_typer
+from examples.pydantic_models import example_012_shared_models as mod
+
+runner = CliRunner()
+
+app = mod.app
+
+
+def test_help():
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    assert "--connection.host" in result.output
+
+    result = runner.invoke(app, ["query", "--help"])
+    assert result.exit_code == 0
+    assert "--connection.host" not in result.output
+
+
+def test_shared_model():
+    result = runner.invoke(app, ["--connection.host", "db", "query", "SELECT 1"])
+    assert "Connecting to host='db' port=5432" in result.output
+    assert "Query 'SELECT 1' on db:5432" in result.output
+
+
+def test_validated_once():
+    validations = []
+
+    class CountingConnection(mod.Connection):
+        @pydantic.model_validator(mode="after")
+        def count(self):
+            validations.append(self)
+            return self
+
+    chain_app = pydantic_typer.Typer(chain=True)
+
+    @chain_app.callback()
+    def main(connection: CountingConnection):  # noqa: ARG001
+        pass
+
+    @chain_app.command()
+    def first(connection: Annotated[CountingConnection, pydantic_typer.Shared()]):
+        typer.echo(f"first {id(connection)}")
+
+    @chain_app.command()
+    def second(connection: Annotated[CountingConnection, pydantic_typer.Shared()]):
+        typer.echo(f"second {id(connection)}")
+
+    result = runner.invoke(chain_app, ["--connection.port", "1", "first", "second"])
+    assert result.exit_code == 0
+    assert len(validations) == 1
+    assert f"first {id(validations[0])}" in result.output
+    assert f"second {id(validations[0])}" in result.output
+
+
+def test_shared_between_chained_commands():
+    chain_app = pydantic_typer.Typer(chain=True)
+
+    @chain_app.command()
+    def connect(connection: mod.Connection):
+        typer.echo(f"connect {id(connection)}")
+
+    @chain_app.command()
+    def status(connection: Annotated[mod.Connection, pydantic_typer.Shared()]):
+        typer.echo(f"status {id(connection)}")
+
+    result = runner.invoke(chain_app, ["connect", "--connection.port", "1", "status"])
+    assert result.exit_code == 0
+    connect_id = result.output.split()[1]
+    assert f"status {connect_id}" in result.output
+
+
+def test_missing_shared_model():
+    sub_app = pydantic_typer.Typer()
+
+    @sub_app.command()
+    def status(connection: Annotated[mod.Connection, pydantic_typer.Shared()]):  # noqa: ARG001
+        pass  # pragma: no cover
+
+    @sub_app.command()
+    def other():
+        pass  # pragma: no cover
+
+    result = runner.invoke(sub_app, ["status"])
+    assert result.exit_code != 0
+    assert "was not validated by a parent command" in result.output
+
+
+def test_add_typer_callback():
+    sub_app = pydantic_typer.Typer()
+
+    @sub_app.command()
+    def status(connection: Annotated[mod.Connection, pydantic_typer.Shared()]):
+        typer.echo(f"Status of {connection.host}")
+
+    def sub_callback(connection: mod.Connection):  # noqa: ARG001
+        pass
+
+    root_app = pydantic_typer.Typer()
+    root_app.add_typer(sub_app, name="sub", callback=sub_callback)
+
+    @root_app.command()
+    def other():
+        pass  # pragma: no cover
+
+    result = runner.invoke(root_app, ["sub", "--connection.host", "db", "status"])
+    assert "Status of db" in result.output
+
+
+def test_script():
+    result = subprocess.run(
+        [sys.executable, "-m", "coverage", "run", mod.__file__, "--help"],
+        capture_output=True,
+        encoding="utf-8",
+        check=False,
+    )
+    assert "Usage" in result.stdout
@@ -0,0 +1,64 @@
+import subprocess
+import sys
+
+from typer.testing import CliRunner
+
+import pydantic_typer
+from examples.pydantic_models import example_013_dataclasses as mod
+
+runner = CliRunner()
+
+app = pydantic_typer.Typer()
+app.command()(mod.main)
+
+
+def test_help():
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    assert "--person.address.city" in result.output
+    assert "--person.pet.species" in result.output
+    assert "The name of the person." in result.output
+
+
+def test_parse_dataclass():
+    result = runner.invoke(
+        app,
+        ["--person.name", "Jeff", "--person.address.city", "Bern", "--person.pet.name", "Lassie", "--person.age", "3"],
+    )
+    assert (
+        "Person(name='Jeff', address=Address(city='Bern', country='Switzerland'), pet={'name': 'Lassie'}, age=3) "
+        "<class 'examples.pydantic_models.example_013_dataclasses.Person'>"
+    ) in result.output
+
+
+def test_typed_dict_not_required_key():
+    result = runner.invoke(
+        app,
+        [
+            "--person.name",
+            "Jeff",
+            "--person.address.city",
+            "Bern",
+            "--person.pet.name",
+            "Lassie",
+            "--person.pet.species",
+            "dog",
+        ],
+    )
+    assert "pet={'name': 'Lassie', 'species': 'dog'}" in result.output
+
+
+def test_missing_required_field():
+    result = runner.invoke(app, ["--person.name", "Jeff", "--person.pet.name", "Lassie"])
+    assert result.exit_code != 0
+    assert "--person.address.city" in result.output
+
+
+def test_script():
+    result = subprocess.run(
+        [sys.executable, "-m", "coverage", "run", mod.__file__, "--help"],
+        capture_output=True,
+        encoding="utf-8",
+        check=False,
+    )
+    assert "Usage" in result.stdout
@@ -0,0 +1,100 @@
+import dataclasses
+import subprocess
+import sys
+from typing import List
+
+import pydantic
+import typer
+from typer.testing import CliRunner
+
+import pydantic_typer
+from examples.pydantic_models import example_014_default_factory as mod
+
+runner = CliRunner()
+
+app = pydantic_typer.Typer()
+app.command()(mod.main)
+
+
+def test_help():
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    assert "uuid4" in result.output
+    assert "dynamic" in result.output
+
+
+def test_default_factory():
+    result = runner.invoke(app, [])
+    assert result.exit_code == 0
+    assert "tags=['default']" in result.output
+
+
+def test_override_default_factory():
+    result = runner.invoke(
+        app, ["--job.id", "3f2a6c1e-7a43-4f55-9a7e-1f2f3b5a8c9d", "--job.tags", "a", "--job.tags", "b"]
+    )
+    assert "id=UUID('3f2a6c1e-7a43-4f55-9a7e-1f2f3b5a8c9d') tags=['a', 'b']" in result.output
+
+
+def test_factory_only_called_when_omitted():
+    calls = []
+
+    def expensive_default():
+        calls.append(1)
+        return "computed"
+
+    class Model(pydantic.BaseModel):
+        value: str = pydantic.Field(default_factory=expensive_default)
+
+    factory_app = pydantic_typer.Typer()
+
+    @factory_app.command()
+    def main(model: Model):
+        typer.echo(model.value)
+
+    result = runner.invoke(factory_app, ["--help"])
+    assert "expensive_default" in result.output
+    assert calls == []
+
+    result = runner.invoke(factory_app, ["--model.value", "passed"])
+    assert "passed" in result.output
+    assert calls == []
+
+    result = runner.invoke(factory_app, [])
+    assert "computed" in result.output
+    assert calls == [1]
+
+
+@dataclasses.dataclass
+class TagsFactory:
+    tags: list
+
+    def __call__(self):
+        return list(self.tags)
+
+
+def test_unhashable_default_factory():
+    class Model(pydantic.BaseModel):
+        # Local models can't use postponed annotations
+        tags: List[str] = pydantic.Field(default_factory=TagsFactory(["a"]))  # noqa: FA100
+
+    factory_app = pydantic_typer.Typer()
+
+    @factory_app.command()
+    def main(model: Model):
+        typer.echo(model.tags)
+
+    result = runner.invoke(factory_app, ["--help"])
+    assert "dynamic" in result.output
+    result = runner.invoke(factory_app, [])
+    assert "['a']" in result.output
+
+
+def test_script():
+    result = subprocess.run(
+        [sys.executable, "-m", "coverage", "run", mod.__file__, "--help"],
+        capture_output=True,
+        encoding="utf-8",
+        check=False,
+    )
+    assert "Usage" in result.stdout
@@ -0,0 +1,126 @@
+import io
+import subprocess
+import sys
+import threading
+
+from typer.core import TyperCommand
+from typer.testing import CliRunner
+
+import pydantic_typer
+from examples.pydantic_models import example_015_grouped_help as mod
+from pydantic_typer import help as pydantic_typer_help
+
+runner = CliRunner()
+
+app = pydantic_typer.Typer()
+app.command()(mod.main)
+
+
+def test_help():
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    for panel in ("─ config ─", "─ config.database ─", "─ config.database.credentials ─"):
+        assert panel in result.output
+    assert "--verbose" in result.output
+
+
+def test_help_path():
+    result = runner.invoke(app, ["--help", "config.database"])
+    assert result.exit_code == 0
+    assert "--config.database.host" in result.output
+    assert "─ config.database.credentials ─" in result.output
+    assert "--config.name" not in result.output
+    assert "--verbose" not in result.output
+
+
+def test_unknown_help_path():
+    result = runner.invoke(app, ["--help", "config.unknown"])
+    assert result.exit_code == 0
+    assert "--config.name" in result.output
+
+
+def test_parse():
+    result = runner.invoke(app, ["--config.name", "test", "--config.database.credentials.user", "root"])
+    assert "credentials=Credentials(user='root', password='secret')" in result.output
+
+
+def test_verbose():
+    result = runner.invoke(app, ["--config.name", "test", "--config.database.credentials.user", "root", "--verbose"])
+    assert result.exit_code == 0, result.output
+    assert "Connecting to localhost" in result.output
+
+
+def test_help_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv(pydantic_typer_help.HELP_CACHE_DIR_ENV_VAR, str(tmp_path))
+    monkeypatch.setattr(pydantic_typer_help, "HELP_CACHE_MIN_PARAMS", 0)
+    renders = []
+    original_format_help = TyperCommand.format_help
+
+    def counting_format_help(self, ctx, formatter):
+        renders.append(self)
+        return original_format_help(self, ctx, formatter)
+
+    monkeypatch.setattr(TyperCommand, "format_help", counting_format_help)
+
+    first = runner.invoke(app, ["--help"])
+    assert len(renders) == 1
+    assert len(list(tmp_path.iterdir())) == 1
+
+    second = runner.invoke(app, ["--help"])
+    assert len(renders) == 1
+    assert second.output == first.output
+
+    runner.invoke(app, ["--help", "config.database"])
+    assert len(renders) == 2  # noqa: PLR2004
+    assert len(list(tmp_path.iterdir())) == 2  # noqa: PLR2004
+
+
+def test_help_cache_disabled(tmp_path, monkeypatch):
+    monkeypatch.delenv(pydantic_typer_help.HELP_CACHE_DIR_ENV_VAR, raising=False)
+    monkeypatch.setattr(pydantic_typer_help, "HELP_CACHE_MIN_PARAMS", 0)
+    monkeypatch.setattr(pydantic_typer_help.click, "get_app_dir", lambda *_, **__: str(tmp_path))
+    result = runner.invoke(app, ["--help"])
+    assert "--config.name" in result.output
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_help_cache_keyed_by_command(tmp_path, monkeypatch):
+    monkeypatch.setenv(pydantic_typer_help.HELP_CACHE_DIR_ENV_VAR, str(tmp_path))
+    monkeypatch.setattr(pydantic_typer_help, "HELP_CACHE_MIN_PARAMS", 0)
+    for help_text in ("ONE", "TWO"):
+        help_app = pydantic_typer.Typer()
+        help_app.command(help=help_text)(mod.main)
+        assert help_text in runner.invoke(help_app, ["--help"]).output
+    assert len(list(tmp_path.iterdir())) == 2  # noqa: PLR2004
+
+
+def test_help_cache_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setenv(pydantic_typer_help.HELP_CACHE_DIR_ENV_VAR, str(tmp_path))
+    monkeypatch.setattr(pydantic_typer_help, "HELP_CACHE_MIN_PARAMS", 0)
+    monkeypatch.setattr(pydantic_typer_help, "HELP_CACHE_MAX_FILES", 2)
+    for help_text in ("ONE", "TWO", "THREE"):
+        help_app = pydantic_typer.Typer()
+        help_app.command(help=help_text)(mod.main)
+        runner.invoke(help_app, ["--help"])
+    assert len(list(tmp_path.iterdir())) == 2  # noqa: PLR2004
+
+
+def test_help_capture_is_per_thread(capsys):
+    output = io.StringIO()
+    with pydantic_typer_help._stdout_router.capture(output):  # noqa: SLF001
+        thread = threading.Thread(target=print, args=("other",))
+        thread.start()
+        thread.join()
+        print("help")  # noqa: T201
+    assert output.getvalue() == "help\n"
+    assert capsys.readouterr().out == "other\n"
+
+
+def test_script():
+    result = subprocess.run(
+        [sys.executable, "-m", "coverage", "run", mod.__file__, "--help"],
+        capture_output=True,
+        encoding="utf-8",
+        check=False,
+    )
+    assert "Usage" in result.stdout
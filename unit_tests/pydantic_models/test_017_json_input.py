@@ -0,0 +1,126 @@
+import json
+import subprocess
+import sys
+
+import pytest
+import typer
+import typer.main
+from typer.core import TyperGroup
+from typer.testing import CliRunner
+
+import pydantic_typer
+from examples.pydantic_models import example_017_json_input as mod
+from pydantic_typer.json_input import PydanticTyperGroup
+
+runner = CliRunner()
+
+app = pydantic_typer.Typer()
+app.command()(mod.main)
+
+PERSON = {"name": "Jeff", "age": 42, "pet": {"name": "Lassie", "species": "dog"}}
+
+
+def test_help():
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    assert "--person-json" in result.output
+
+
+def test_json():
+    result = runner.invoke(app, ["--person-json", json.dumps(PERSON)])
+    assert result.exit_code == 0, result.output
+    assert "name='Jeff' age=42.0 pet=Pet(name='Lassie', species='dog')" in result.output
+
+
+def test_json_file(tmp_path):
+    path = tmp_path / "person.json"
+    path.write_text(json.dumps(PERSON))
+    result = runner.invoke(app, ["--person", f"@{path}"])
+    assert result.exit_code == 0, result.output
+    assert "name='Jeff' age=42.0 pet=Pet(name='Lassie', species='dog')" in result.output
+
+
+def test_missing_json_file(tmp_path):
+    result = runner.invoke(app, ["--person", f"@{tmp_path / 'missing.json'}"])
+    assert result.exit_code != 0
+    assert "Could not read" in result.output
+
+
+def test_override_fields():
+    result = runner.invoke(app, ["--person-json", json.dumps(PERSON), "--person.pet.name", "Laika"])
+    assert result.exit_code == 0, result.output
+    # Fields which are not passed as options keep their value from the JSON
+    assert "name='Jeff' age=42.0 pet=Pet(name='Laika', species='dog')" in result.output
+
+
+def test_invalid_json():
+    result = runner.invoke(app, ["--person-json", "{", "--person.name", "Jeff"])
+    assert result.exit_code != 0
+    assert "Invalid value for --person-json" in result.output
+
+
+def test_json_not_matching_model():
+    for value in ('{"name": "Jeff"}', "[1]"):
+        result = runner.invoke(app, ["--person-json", value])
+        assert result.exit_code == 2, result.output  # noqa: PLR2004
+        assert "Invalid value for --person-json" in result.output
+
+
+def test_option_clashes():
+    def main(person: mod.Person, person_json: str = "x"):
+        return person, person_json
+
+    with pytest.raises(RuntimeError, match="--person-json of .* also an option of person_json"):
+        pydantic_typer.enable_pydantic(main)
+
+
+class CustomGroup(PydanticTyperGroup):
+    pass
+
+
+def test_custom_group_class():
+    root = pydantic_typer.Typer(cls=CustomGroup)
+    sub = pydantic_typer.Typer(cls=CustomGroup)
+
+    @root.callback()
+    def main(person: mod.Person):
+        typer.echo(person.name)
+
+    @sub.callback()
+    def sub_main():
+        pass
+
+    @sub.command()
+    def show():
+        pass
+
+    root.add_typer(sub, name="sub")
+    group = typer.main.get_command(root)
+    assert type(group) is CustomGroup
+    assert type(group.commands["sub"]) is CustomGroup  # type: ignore[attr-defined]
+
+
+def test_group_class_without_json_input():
+    app = pydantic_typer.Typer(cls=TyperGroup)
+
+    with pytest.raises(RuntimeError, match="TyperGroup can't take the models of .*main as JSON"):
+
+        @app.callback()
+        def main(person: mod.Person):
+            return person
+
+
+def test_required_fields_without_json():
+    result = runner.invoke(app, ["--person.name", "Jeff"])
+    assert result.exit_code != 0
+    assert "Missing option '--person.pet.name'" in result.output
+
+
+def test_script():
+    result = subprocess.run(
+        [sys.executable, "-m", "coverage", "run", mod.__file__, "--help"],
+        capture_output=True,
+        encoding="utf-8",
+        check=False,
+    )
+    assert "Usage" in result.stdout
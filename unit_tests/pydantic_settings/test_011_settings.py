@@ -0,0 +1,100 @@
+import os
+import subprocess
+import sys
+
+import pydantic_settings
+import pytest
+from typer.testing import CliRunner
+
+import pydantic_typer
+from examples.pydantic_settings import example_011_settings as mod
+from pydantic_typer.settings import build_settings, clear_settings_cache
+
+runner = CliRunner()
+
+app = pydantic_typer.Typer()
+app.command()(mod.main)
+
+
+@pytest.fixture(autouse=True)
+def settings_env(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("APP_USER", "env-user")
+    monkeypatch.setenv("APP_DATABASE__PORT", "1234")
+    clear_settings_cache()
+    yield
+    clear_settings_cache()
+
+
+def test_help():
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    assert "--settings.database.host" in result.output
+    # The other settings sources decide the defaults
+    assert "default:" not in result.output
+
+
+def test_settings_from_env():
+    result = runner.invoke(app, [])
+    assert "user='env-user' debug=False database=Database(host='localhost', port=1234)" in result.output
+
+
+def test_override_env_with_options():
+    result = runner.invoke(app, ["--settings.user", "cli-user", "--settings.database.host", "db"])
+    assert "user='cli-user' debug=False database=Database(host='db', port=1234)" in result.output
+
+
+def test_override_env_with_false(monkeypatch):
+    monkeypatch.setenv("APP_DEBUG", "1")
+    result = runner.invoke(app, [])
+    assert "user='env-user' debug=True" in result.output
+    result = runner.invoke(app, ["--no-settings.debug"])
+    assert "user='env-user' debug=False" in result.output
+    result = runner.invoke(app, ["--settings.debug"])
+    assert "user='env-user' debug=True" in result.output
+
+
+def test_missing_required_field(monkeypatch):
+    monkeypatch.delenv("APP_USER")
+    result = runner.invoke(app, [])
+    assert result.exit_code != 0
+
+
+def test_sources_are_cached(monkeypatch):
+    calls = []
+    original_call = pydantic_settings.EnvSettingsSource.__call__
+
+    def counting_call(self):
+        calls.append(self)
+        return original_call(self)
+
+    monkeypatch.setattr(pydantic_settings.EnvSettingsSource, "__call__", counting_call)
+    build_settings(mod.Settings, {})
+    resolved_calls = len(calls)
+    assert resolved_calls > 0
+    settings = build_settings(mod.Settings, {"user": "other"})
+    assert settings.user == "other"
+    assert len(calls) == resolved_calls
+
+
+def test_cache_invalidated_by_env_file(tmp_path, monkeypatch):
+    monkeypatch.delenv("APP_USER")
+    env_file = tmp_path / ".env"
+    env_file.write_text("APP_USER=dotenv-user\n")
+    assert build_settings(mod.Settings, {}).user == "dotenv-user"
+
+    env_file.write_text("APP_USER=changed-user\n")
+    stat = env_file.stat()
+    # Make sure the modification time changes, even on file systems with a coarse resolution.
+    os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert build_settings(mod.Settings, {}).user == "changed-user"
+
+
+def test_script():
+    result = subprocess.run(
+        [sys.executable, "-m", "coverage", "run", mod.__file__, "--help"],
+        capture_output=True,
+        encoding="utf-8",
+        check=False,
+    )
+    assert "Usage" in result.stdout
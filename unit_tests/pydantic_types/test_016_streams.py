@@ -0,0 +1,110 @@
+import base64
+import hashlib
+import subprocess
+import sys
+
+import pydantic
+import pytest
+from typer.testing import CliRunner
+from typing_extensions import Annotated
+
+import pydantic_typer
+from examples.pydantic_types import example_016_streams as mod
+from pydantic_typer import Stream, streams
+
+runner = CliRunner()
+
+app = pydantic_typer.Typer()
+app.command()(mod.main)
+
+
+@pytest.fixture
+def files(tmp_path):
+    data = tmp_path / "data.bin"
+    data.write_bytes(b"data" * 1000)
+    blob = tmp_path / "blob.bin"
+    blob.write_bytes(bytes(range(256)))
+    payload = tmp_path / "payload.b64"
+    payload.write_bytes(base64.encodebytes(b"hello streams" * 100))
+    return tmp_path
+
+
+def invoke(files, **overrides):
+    args = {
+        "data": files / "data.bin",
+        "blob": files / "blob.bin",
+        "payload": files / "payload.b64",
+        "output": files / "output.bin",
+        **overrides,
+    }
+    return runner.invoke(
+        app, ["--upload.data", str(args["data"]), str(args["blob"]), str(args["payload"]), str(args["output"])]
+    )
+
+
+def test_help():
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    assert "--upload.data" in result.output
+    assert "PATH" in result.output
+
+
+def test_streams(files):
+    result = invoke(files)
+    assert result.exit_code == 0, result.output
+    assert f"data: {hashlib.sha256(b'data' * 1000).hexdigest()}" in result.output
+    assert f"blob: {bytes(range(16))!r} <class 'memoryview'>" in result.output
+    assert f"payload: {b'hello streams' * 100!r}" in result.output
+    assert (files / "output.bin").read_bytes() == b"done"
+
+
+def test_missing_file(files):
+    result = invoke(files, data=files / "missing.bin")
+    assert isinstance(result.exception, pydantic.ValidationError)
+    assert "Path does not point to a file" in str(result.exception)
+
+
+def test_existing_output(files):
+    result = invoke(files, output=files / "data.bin")
+    assert result.exit_code != 0
+    assert "Path already exists" in result.output
+
+
+def test_size_constraint(files):
+    (files / "large.bin").write_bytes(bytes(2048))
+    result = invoke(files, blob=files / "large.bin")
+    assert result.exit_code != 0
+    assert "File should have at most 1024 bytes" in result.output
+
+
+def test_decode_in_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(streams, "DECODE_CHUNK_SIZE", 7)
+    content = bytes(range(256)) * 10
+    path = tmp_path / "payload.b64"
+    path.write_bytes(base64.encodebytes(content))
+    adapter = pydantic.TypeAdapter(Annotated[pydantic.Base64Bytes, Stream()])
+    with adapter.validate_python(str(path)) as stream:
+        assert stream.read() == content
+
+
+def test_invalid_encoding(tmp_path):
+    path = tmp_path / "payload.b64"
+    path.write_bytes(b"abc")
+    adapter = pydantic.TypeAdapter(Annotated[pydantic.Base64Bytes, Stream()])
+    with pytest.raises(ValueError, match="Base64 decoding error"), adapter.validate_python(str(path)) as stream:
+        stream.read()
+
+
+def test_unsupported_type():
+    with pytest.raises(TypeError, match="Stream\\(\\) supports paths and bytes"):
+        pydantic.TypeAdapter(Annotated[int, Stream()])
+
+
+def test_script():
+    result = subprocess.run(
+        [sys.executable, "-m", "coverage", "run", mod.__file__, "--help"],
+        capture_output=True,
+        encoding="utf-8",
+        check=False,
+    )
+    assert "Usage" in result.stdout
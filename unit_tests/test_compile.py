@@ -0,0 +1,177 @@
+import importlib.util
+import os
+import subprocess
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+from pydantic_typer.compiler import CompileError, compile_app
+from pydantic_typer.settings import clear_settings_cache
+
+runner = CliRunner()
+
+
+def _load(path):
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def app_module(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    path = tmp_path / "compiled_app.py"
+    path.write_text(
+        "import pydantic_typer\n"
+        "from examples.pydantic_models.example_002_nested_models import main as nested\n"
+        "from examples.pydantic_types.example_009_union_types import main as union\n"
+        "from examples.pydantic_settings.example_011_settings import main as settings\n"
+        "from examples.pydantic_models.example_014_default_factory import main as factory\n"
+        "app = pydantic_typer.Typer()\n"
+        "app.command('nested')(nested)\n"
+        "app.command('union')(union)\n"
+        "app.command('settings')(settings)\n"
+        "app.command('factory')(factory)\n"
+    )
+    yield path
+    sys.modules.pop("compiled_app", None)
+
+
+@pytest.fixture
+def compiled(app_module, tmp_path):  # noqa: ARG001 The app module must be written before compiling it
+    output = tmp_path / "compiled_cli.py"
+    output.write_text(compile_app("compiled_app:app", str(output)))
+    return _load(output)
+
+
+def test_help(compiled):
+    result = runner.invoke(compiled.cli, ["nested", "--help"])
+    assert result.exit_code == 0
+    assert "--person.pet.species" in result.output
+
+
+def test_models_not_imported_for_help(compiled):
+    sys.modules.pop("compiled_app", None)
+    runner.invoke(compiled.cli, ["union", "--help"])
+    assert "compiled_app" not in sys.modules
+
+
+def test_nested_models(compiled):
+    result = runner.invoke(
+        compiled.cli, ["nested", "--person.name", "Jeff", "--person.pet.name", "Lassie", "--person.pet.species", "dog"]
+    )
+    assert "name='Jeff' age=None pet=Pet(name='Lassie', species='dog')" in result.output
+
+
+def test_json_input(compiled):
+    person = '{"name": "Jeff", "pet": {"name": "Lassie", "species": "dog"}}'
+    result = runner.invoke(compiled.cli, ["nested", "--person-json", person, "--person.pet.name", "Laika"])
+    assert "name='Jeff' age=None pet=Pet(name='Laika', species='dog')" in result.output
+
+
+def test_json_not_matching_model(compiled):
+    for args in (["--person-json", '{"name": "Jeff"}'], ["--person-json", '{"pet": {}}', "--person.name", "Jeff"]):
+        result = runner.invoke(compiled.cli, ["nested", *args])
+        assert result.exit_code == 2, result.output  # noqa: PLR2004
+        assert "Invalid value for --person-json" in result.output
+
+
+def test_union_types(compiled):
+    result = runner.invoke(compiled.cli, ["union", "--value", "2.0"])
+    assert "int" in result.output
+
+
+def test_default_factories(compiled):
+    result = runner.invoke(compiled.cli, ["factory"])
+    assert "tags=['default']" in result.output
+    result = runner.invoke(compiled.cli, ["factory", "--job.tags", "a", "--job.tags", "b"])
+    assert "tags=['a', 'b']" in result.output
+
+
+def test_settings_flags(compiled, monkeypatch):
+    monkeypatch.setenv("APP_USER", "env-user")
+    monkeypatch.setenv("APP_DEBUG", "1")
+    clear_settings_cache()
+    result = runner.invoke(compiled.cli, ["settings"])
+    assert "user='env-user' debug=True" in result.output
+    result = runner.invoke(compiled.cli, ["settings", "--no-settings.debug"])
+    assert "user='env-user' debug=False" in result.output
+    clear_settings_cache()
+
+
+def test_fingerprint(compiled, app_module):
+    compiled.check_fingerprint()
+    app_module.write_text(app_module.read_text() + "\n# changed\n")
+    with pytest.raises(SystemExit, match="out of date"):
+        compiled.check_fingerprint()
+
+
+def test_not_importable():
+    with pytest.raises(CompileError):
+        compile_app("examples.pydantic_models.example_001_basic:main")
+
+
+@pytest.mark.usefixtures("app_module")
+def test_script(tmp_path):
+    output = tmp_path / "compiled_cli.py"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(tmp_path), os.getcwd()])}
+    result = subprocess.run(
+        [sys.executable, "-m", "pydantic_typer", "compile", "compiled_app:app", "-o", str(output)],
+        capture_output=True,
+        encoding="utf-8",
+        check=False,
+        cwd=tmp_path,
+        env=env,
+    )
+    assert result.returncode == 0, result.stderr
+    result = subprocess.run(
+        [sys.executable, str(output), "--help"], capture_output=True, encoding="utf-8", check=False, env=env
+    )
+    assert "Usage" in result.stdout
+
+
+def test_shared_models(tmp_path):
+    output = tmp_path / "shared_cli.py"
+    output.write_text(compile_app("examples.pydantic_models.example_012_shared_models:app", str(output)))
+    compiled = _load(output)
+    result = runner.invoke(compiled.cli, ["--connection.host", "db", "query", "SELECT 1"])
+    assert "Query 'SELECT 1' on db:5432" in result.output
+
+
+def test_plain_commands_import_nothing(tmp_path):
+    (tmp_path / "plain_commands.py").write_text("def other(number: int):\n    print(number)\n")
+    (tmp_path / "plain_app.py").write_text(
+        "import pydantic_typer\n"
+        "from plain_commands import other\n"
+        "app = pydantic_typer.Typer()\n"
+        "app.command('other')(other)\n"
+        "app.command('other2')(other)\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(tmp_path), os.getcwd()])}
+    compiled = subprocess.run(
+        [sys.executable, "-m", "pydantic_typer", "compile", "plain_app:app", "-o", str(tmp_path / "plain_cli.py")],
+        capture_output=True,
+        encoding="utf-8",
+        check=False,
+        cwd=tmp_path,
+        env=env,
+    )
+    assert compiled.returncode == 0, compiled.stderr
+    script = (
+        "import sys, plain_cli\n"
+        "plain_cli.cli(['other', '3'], standalone_mode=False)\n"
+        "print(sorted({'typer', 'rich', 'pydantic', 'pydantic_typer.main'} & set(sys.modules)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, encoding="utf-8", check=False, cwd=tmp_path, env=env
+    )
+    assert result.stdout == "3\n[]\n", result.stderr
+
+
+def test_validators_built_once(compiled):
+    for value in ("2.0", "3.0"):
+        result = runner.invoke(compiled.cli, ["union", "--value", value])
+        assert "int" in result.output
+    assert len(compiled._VALIDATORS) == 1  # noqa: SLF001
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pydantic
+import typer
+import typer.main
+from typer.testing import CliRunner
+from typing_extensions import Annotated
+
+import pydantic_typer
+
+runner = CliRunner()
+
+
+class Pet(pydantic.BaseModel):
+    name: Annotated[str, typer.Option()] = pydantic.Field(description="The pet's name")
+    tags: List[str] = pydantic.Field(default_factory=list)  # noqa: UP006 For Python versions >=3.9, prefer list[str]
+
+
+def pet_command(number: int, pet: Pet):
+    return number, pet
+
+
+def animal_command(number: int, animal: Pet):
+    return number, animal
+
+
+def _app():
+    app = pydantic_typer.Typer()
+    app.command("pet")(pet_command)
+    app.command("animal")(animal_command)
+    return app
+
+
+def test_model_metadata_is_not_modified():
+    app = _app()
+    assert "--pet.name" in runner.invoke(app, ["pet", "--help"]).output
+    assert "--animal.name" in runner.invoke(app, ["animal", "--help"]).output
+    option = Pet.model_fields["name"].metadata[0]
+    assert option.param_decls == ()
+    assert option.help is None
+    assert option.rich_help_panel is None
+
+
+def test_concurrent_invocation():
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # Build the apps concurrently as well
+        groups = list(executor.map(lambda _: typer.main.get_command(_app()), range(8)))
+
+        def invoke(i):
+            root = "pet" if i % 2 else "animal"
+            args = [root, str(i), f"--{root}.name", f"pet{i}", f"--{root}.tags", str(i)]
+            return groups[i % len(groups)].main(args, standalone_mode=False)
+
+        results = list(executor.map(invoke, range(200)))
+    assert results == [(i, Pet(name=f"pet{i}", tags=[str(i)])) for i in range(200)]
+
+
+def test_shared_command_invocation():
+    group = typer.main.get_command(_app())
+
+    def invoke(i):
+        return group.main(["pet", str(i), "--pet.name", f"pet{i}"], standalone_mode=False)
+
+    # Switch threads as often as possible, to interleave the invocations
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(invoke, range(1000)))
+    finally:
+        sys.setswitchinterval(interval)
+    assert results == [(i, Pet(name=f"pet{i}")) for i in range(1000)]
@@ -0,0 +1,110 @@
+import gc
+import inspect
+import tracemalloc
+import weakref
+from typing import Any, Dict, Optional
+
+import pydantic
+import typer
+from typer.testing import CliRunner
+from typing_extensions import Annotated
+
+import pydantic_typer
+from pydantic_typer.main import _enable_pydantic_support
+
+runner = CliRunner()
+
+# The models in the tests are local, so this module doesn't postpone the evaluation of annotations.
+inner_fields: Dict[str, Any] = {f"field_{i}": (Optional[int], None) for i in range(100)}  # noqa: FA100
+Inner = pydantic.create_model("Inner", **inner_fields)
+large_fields: Dict[str, Any] = {  # noqa: FA100
+    "inner": (Inner, ...),
+    **{f"value_{i}": (str, "x") for i in range(100)},
+}
+# The fields are only known at runtime
+Large: Any = pydantic.create_model("Large", **large_fields)
+
+
+def _command():
+    def command(large: Large, count: int = 1):
+        return large, count
+
+    return _enable_pydantic_support(command)
+
+
+def _allocated_since(snapshot: tracemalloc.Snapshot) -> int:
+    gc.collect()
+    return sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(snapshot, "filename"))
+
+
+def test_flattened_fields_are_shared():
+    first, second = _command(), _command()
+    first_parameters = inspect.signature(first).parameters
+    second_parameters = inspect.signature(second).parameters
+    assert len(first_parameters) == 202  # noqa: PLR2004
+    for name, qualifier in (
+        ("_pydantic_large_inner_field_0", ("large", "inner", "field_0")),
+        ("_pydantic_large_value_99", ("large", "value_99")),
+    ):
+        assert first_parameters[name] is second_parameters[name]
+        assert first_parameters[name].annotation.__metadata__[1] == qualifier
+
+
+def test_memory_per_command():
+    commands = [_command()]
+    tracemalloc.start()
+    try:
+        snapshot = tracemalloc.take_snapshot()
+        commands += [_command() for _ in range(10)]
+        per_command = _allocated_since(snapshot) / 10
+        tracemalloc.clear_traces()
+        snapshot = tracemalloc.take_snapshot()
+
+        class Other(Large):
+            pass
+
+        def command(other: Other):
+            return other
+
+        commands.append(_enable_pydantic_support(command))
+        first_command = _allocated_since(snapshot)
+    finally:
+        tracemalloc.stop()
+    # Commands using a model which was already flattened only allocate their wrapper and signature.
+    assert per_command < first_command / 4
+
+
+def test_shared_model_in_app():
+    app = pydantic_typer.Typer()
+
+    @app.command("a")
+    def a(large: Large):
+        typer.echo(f"a {large.inner.field_1} {large.value_1}")
+
+    @app.command("b")
+    def b(large: Large):
+        typer.echo(f"b {large.inner.field_1} {large.value_1}")
+
+    result = runner.invoke(app, ["a", "--large.inner.field_1", "1"])
+    assert result.exit_code == 0, result.output
+    assert result.output == "a 1 x\n"
+    result = runner.invoke(app, ["b", "--large.value_1", "y"])
+    assert result.exit_code == 0, result.output
+    assert result.output == "b None y\n"
+
+
+def test_models_are_not_kept_alive():
+    def decorate():
+        class Temporary(pydantic.BaseModel):
+            inner: Inner
+            name: str = "x"
+
+        def command(temporary: Temporary, argument: Annotated[Temporary, typer.Argument()]):
+            return temporary, argument
+
+        _enable_pydantic_support(command)
+        return weakref.ref(Temporary)
+
+    model = decorate()
+    gc.collect()
+    assert model() is None
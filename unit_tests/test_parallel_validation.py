@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List
+
+import pydantic
+import pytest
+import typer
+from typer.testing import CliRunner
+from typing_extensions import Annotated
+
+import pydantic_typer
+from pydantic_typer import parallel_validation
+
+runner = CliRunner()
+
+results: List[Any] = []  # noqa: UP006 For Python versions >=3.9, prefer list[Any]
+
+
+def urls_command(
+    urls: List[pydantic.HttpUrl] = typer.Option(..., "--url"),  # noqa: B008, UP006 For Python versions >=3.9, prefer list[pydantic.HttpUrl]
+    limited: Annotated[
+        List[pydantic.HttpUrl],  # noqa: UP006 For Python versions >=3.9, prefer list[pydantic.HttpUrl]
+        pydantic.Field(max_length=8),
+    ] = typer.Option([], "--limited"),  # noqa: B008
+):
+    results.append((urls, limited))
+
+
+app = pydantic_typer.Typer()
+app.command()(urls_command)
+
+
+@pytest.fixture(autouse=True)
+def executor():
+    results.clear()
+    with ThreadPoolExecutor(2) as executor:
+        parallel_validation.configure(threshold=4, chunk_size=3, executor=executor)
+        yield executor
+    parallel_validation.configure(threshold=None)
+
+
+def _args(option, urls):
+    return [arg for url in urls for arg in (option, url)]
+
+
+def test_parallel_validation(executor, monkeypatch):
+    submitted = []
+    submit = executor.submit
+    monkeypatch.setattr(executor, "submit", lambda *args: submitted.append(args) or submit(*args))
+    urls = [f"https://example.com/{i}" for i in range(10)]
+    result = runner.invoke(app, [*_args("--url", urls)])
+    assert result.exit_code == 0, result.output
+    [(validated, _)] = results
+    assert [str(url) for url in validated] == urls
+    assert [args[2] for args in submitted] == [0, 3, 6, 9]
+
+
+def test_below_threshold(executor, monkeypatch):
+    monkeypatch.setattr(executor, "submit", None)
+    result = runner.invoke(app, [*_args("--url", ["https://example.com"] * 3)])
+    assert result.exit_code == 0, result.output
+    assert len(results[0][0]) == 3  # noqa: PLR2004
+
+
+def test_errors_have_original_indices():
+    urls = ["https://example.com"] * 10
+    urls[7] = "ftp://example.com"
+    result = runner.invoke(app, [*_args("--url", urls)])
+    assert result.exit_code != 0
+    assert "URL scheme should be 'http' or 'https' (item 7)" in result.output
+
+
+def test_all_errors_are_merged():
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        parallel_validation.validate(pydantic.HttpUrl, ["x", "https://example.com", "y", "z", "https://example.com"])
+    assert [error["loc"] for error in exc_info.value.errors()] == [(0,), (2,), (3,)]
+    assert exc_info.value.errors()[0]["msg"] == "Input should be a valid URL, relative URL without a base"
+
+
+def test_constrained_lists_are_validated_at_once():
+    urls = ["https://example.com"] * 9
+    result = runner.invoke(app, ["--url", "https://example.com", *_args("--limited", urls)])
+    assert result.exit_code != 0
+    assert "List should have at most 8 items" in result.output
+
+
+def test_process_pool():
+    parallel_validation.configure(threshold=4, chunk_size=2, max_workers=1)
+    try:
+        validated = parallel_validation.validate(int, ["1", "2", "3", "4", "5"])
+    finally:
+        parallel_validation.shutdown()
+    assert validated == [1, 2, 3, 4, 5]
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from typing import Any, List
+
+import pydantic
+import pytest
+from typer.testing import CliRunner
+
+import pydantic_typer
+from pydantic_typer import validation_cache
+
+runner = CliRunner()
+
+
+class Config(pydantic.BaseModel):
+    name: str
+    urls: List[str] = []  # noqa: UP006 For Python versions >=3.9, prefer list[str]
+
+
+class FrozenConfig(Config):
+    model_config = pydantic.ConfigDict(frozen=True)
+
+
+results: List[Any] = []  # noqa: UP006 For Python versions >=3.9, prefer list[Any]
+
+
+def config_command(config: Config, url: pydantic.HttpUrl):
+    results.append((config.model_copy(), url))
+    config.name = "changed"
+
+
+def frozen_command(config: FrozenConfig):
+    results.append((config, None))
+
+
+app = pydantic_typer.Typer()
+app.command("config")(config_command)
+app.command("frozen")(frozen_command)
+
+
+@pytest.fixture(autouse=True)
+def cache():
+    results.clear()
+    validation_cache.configure(maxsize=128)
+    yield validation_cache
+    validation_cache.configure(maxsize=0)
+    validation_cache.cache_clear()
+
+
+def invoke(*args):
+    result = runner.invoke(app, list(args))
+    assert result.exit_code == 0, result.output
+    return results[-1]
+
+
+def test_disabled(cache):
+    cache.configure(maxsize=0)
+    invoke("config", "https://example.com", "--config.name", "a")
+    assert cache.cache_info().hits == cache.cache_info().misses == 0
+
+
+def test_hits_are_copies(cache):
+    first, _ = invoke("config", "https://example.com", "--config.name", "a", "--config.urls", "https://example.com")
+    assert cache.cache_info().misses == 2  # noqa: PLR2004
+    second, url = invoke("config", "https://example.com", "--config.name", "a", "--config.urls", "https://example.com")
+    assert cache.cache_info().hits == 2  # noqa: PLR2004
+    # The first command changed its model, but not the cached one
+    assert second == first
+    assert second.name == "a"
+    assert str(url) == "https://example.com/"
+
+
+def test_different_inputs(cache):
+    invoke("config", "https://example.com", "--config.name", "a")
+    config, _ = invoke("config", "https://example.com", "--config.name", "b")
+    assert config.name == "b"
+    assert cache.cache_info().misses == 3  # noqa: PLR2004
+
+
+def test_frozen_models_are_shared(cache):
+    first, _ = invoke("frozen", "--config.name", "a")
+    second, _ = invoke("frozen", "--config.name", "a")
+    assert first is second
+    assert cache.cache_info().hits == 1
+
+
+def test_validation_errors_are_not_cached(cache):
+    for _ in range(2):
+        result = runner.invoke(app, ["config", "not a url", "--config.name", "a"])
+        assert "Invalid value for url" in result.output
+    # The url is validated first, so the config is never validated
+    assert cache.cache_info().misses == 2  # noqa: PLR2004
+    assert cache.cache_info().currsize == 0
+
+
+def test_evict_by_count(cache):
+    cache.configure(maxsize=2)
+    for name in "abc":
+        invoke("frozen", "--config.name", name)
+    assert cache.cache_info().currsize == 2  # noqa: PLR2004
+    invoke("frozen", "--config.name", "a")
+    assert cache.cache_info().hits == 0
+
+
+def test_evict_by_size(cache):
+    cache.configure(maxsize=128, maxbytes=2000)
+    invoke("frozen", "--config.name", "a")
+    info = cache.cache_info()
+    assert 0 < info.currbytes <= 2000  # noqa: PLR2004
+    invoke("frozen", "--config.name", "b" * 2000)
+    info = cache.cache_info()
+    assert info.currsize == 1
+    assert info.currbytes <= 2000  # noqa: PLR2004
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import inspect
+import sys
+from types import SimpleNamespace
+from typing import Union
+
+import pydantic
+import typer
+from typer.testing import CliRunner
+from typing_extensions import Annotated
+
+import pydantic_typer
+import pydantic_typer.reentrant
+from pydantic_typer.main import _enable_pydantic_support
+from pydantic_typer.utils import inspect_signature
+
+runner = CliRunner()
+
+
+class Pet(pydantic.BaseModel):
+    name: str
+    age: int = 1
+
+
+class Person(pydantic.BaseModel):
+    name: str
+    pet: Pet
+    nickname: Union[int, str] = "none"  # noqa: UP007 For Python versions >=3.10, prefer int | str
+
+
+def _app(main):
+    app = pydantic_typer.Typer()
+    app.command()(main)
+    return app
+
+
+def test_passthrough():
+    def plain(ctx: typer.Context, count: int, name: Annotated[str, typer.Option()] = "x"):
+        return ctx, count, name
+
+    assert _enable_pydantic_support(plain) is plain
+    assert pydantic_typer.enable_pydantic(plain) is plain
+    assert pydantic_typer.enable_pydantic_type_validation(plain) is plain
+
+
+def test_single_call_frame():
+    frames = []
+
+    def main(url: pydantic.HttpUrl, person: Person):
+        frames.append(sys._getframe(1))  # noqa: SLF001
+        typer.echo(f"{url} {person!r}")
+
+    result = runner.invoke(
+        _app(main),
+        ["https://example.com", "--person.name", "Jeff", "--person.pet.name", "Lassie", "--person.nickname", "3"],
+    )
+    assert result.exit_code == 0, result.output
+    assert result.output == ("https://example.com/ Person(name='Jeff', pet=Pet(name='Lassie', age=1), nickname=3)\n")
+    [frame] = frames
+    # The generated wrapper is called by the reentrant callback of the command directly.
+    assert frame.f_code.co_name == "wrapper"
+    assert frame.f_code.co_filename.startswith("<pydantic_typer wrapper of")
+    assert frame.f_back.f_code.co_filename == pydantic_typer.reentrant.__file__
+
+
+def test_stacked_decorators():
+    def main(count: int, url: pydantic.HttpUrl, person: Person):
+        return count, url, person
+
+    wrapper = pydantic_typer.enable_pydantic_type_validation(pydantic_typer.enable_pydantic(main))
+    assert inspect.unwrap(wrapper) is main
+    count, url, person = wrapper(
+        1,
+        "https://example.com",
+        _pydantic_json__person=None,
+        _pydantic_person_name="Jeff",
+        _pydantic_person_pet_name="Lassie",
+        _pydantic_person_pet_age=2,
+        _pydantic_person_nickname="Jeffrey",
+    )
+    assert count == 1
+    assert str(url) == "https://example.com/"
+    assert person == Person(name="Jeff", pet=Pet(name="Lassie", age=2), nickname="Jeffrey")
+
+
+def test_union_field_keeps_option_name():
+    def main(person: Person):
+        typer.echo(repr(person.nickname))
+
+    result = runner.invoke(
+        _app(main), ["--person.name", "Jeff", "--person.pet.name", "Lassie", "--person.nickname", "J"]
+    )
+    assert result.exit_code == 0, result.output
+    assert result.output == "'J'\n"
+
+
+def test_stacked_decorators_without_eval_str(monkeypatch):
+    # Before Python 3.10, signatures are resolved with get_type_hints, which doesn't see the flattened fields.
+    monkeypatch.setattr(pydantic_typer.utils, "sys", SimpleNamespace(version_info=(3, 9)))
+
+    def main(count: int, person: Person):
+        return count, person
+
+    wrapper = pydantic_typer.enable_pydantic_type_validation(pydantic_typer.enable_pydantic(main))
+    assert inspect_signature(wrapper) == inspect.signature(wrapper)
+    count, person = wrapper(
+        1,
+        _pydantic_json__person=None,
+        _pydantic_person_name="Jeff",
+        _pydantic_person_pet_name="Lassie",
+        _pydantic_person_pet_age=2,
+        _pydantic_person_nickname="Jeffrey",
+    )
+    assert count == 1
+    assert person == Person(name="Jeff", pet=Pet(name="Lassie", age=2), nickname="Jeffrey")